@@ -0,0 +1,5 @@
+"""
+Offline benchmark suite for evlog.
+
+Run ``python -m benchmarks --help`` from the repository root.
+"""
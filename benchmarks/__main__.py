@@ -0,0 +1,45 @@
+"""
+Command-line entry point for the evlog benchmarks.
+
+Usage:
+    python -m benchmarks [--locations N] [--events N] [--formats txt,csv,...]
+                         [--cases log_event,...] [--output results.json]
+"""
+import argparse
+import json
+import sys
+
+from .runner import CASES, FORMATS, run_suite
+
+
+def _csv_list(value):
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark evlog's public entry points.")
+    parser.add_argument("--locations", type=int, default=10, help="Number of location files to generate.")
+    parser.add_argument("--events", type=int, default=1000, help="Events per location.")
+    parser.add_argument("--formats", type=_csv_list, default=list(FORMATS), help="Comma-separated file formats.")
+    parser.add_argument("--cases", type=_csv_list, default=list(CASES), help="Comma-separated entry points to time.")
+    parser.add_argument("--no-isolate", action="store_true", help="Run all cases in this process (peak RSS is then cumulative).")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout.")
+    args = parser.parse_args(argv)
+
+    unknown = [case for case in args.cases if case not in CASES] + [fmt for fmt in args.formats if fmt not in FORMATS]
+    if unknown:
+        parser.error(f"unknown cases/formats: {', '.join(unknown)}")
+
+    report = run_suite(args.cases, args.formats, args.locations, args.events, isolate=not args.no_isolate)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=4)
+    else:
+        json.dump(report, sys.stdout, indent=4)
+        sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,44 @@
+"""Synthetic log directories for the benchmarks."""
+import os
+import random
+
+from evlog import EventLogger
+from evlog.logger import format_timestamp, timestamp_to_epoch
+
+DEFAULT_START = "2024-01-01 08:00:00"
+
+
+def location_names(locations):
+    return [f"Location{index:05d}" for index in range(locations)]
+
+
+def generate_log_dir(log_dir, locations=10, events_per_location=1000, file_format="json",
+                     start=DEFAULT_START, seed=0):
+    """
+    Writes ``locations`` log files of ``events_per_location`` alternating
+    Arrival/Departure events each, using evlog's own writers.
+
+    Returns:
+        list: The generated location names.
+    """
+    rng = random.Random(seed)
+    names = location_names(locations)
+    os.makedirs(log_dir, exist_ok=True)
+
+    with EventLogger(log_dir, batch_size=10000, flush_interval=None) as event_logger:
+        for name in names:
+            current = timestamp_to_epoch(start) + rng.randrange(3600)
+            for index in range(events_per_location):
+                # Visits of 15 minutes to 3 hours, gaps of 30 minutes to a day
+                current += rng.randrange(900, 10800) if index % 2 else rng.randrange(1800, 86400)
+                action = "Departure" if index % 2 else "Arrival"
+                event_logger.log(name, action, file_format, timestamp=format_timestamp(current))
+
+    return names
+
+
+def describe(log_dir):
+    """Returns the number of files and total size in bytes of a log directory."""
+    files = [os.path.join(log_dir, name) for name in os.listdir(log_dir)]
+    files = [path for path in files if os.path.isfile(path)]
+    return {"files": len(files), "bytes": sum(os.path.getsize(path) for path in files)}
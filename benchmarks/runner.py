@@ -0,0 +1,181 @@
+"""
+Times evlog's public entry points on synthetic log directories.
+
+Every benchmark case runs in a fresh child process so that its peak RSS is
+measured in isolation and caches from earlier cases do not carry over.
+"""
+import multiprocessing
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+import evlog
+from . import datagen
+
+CASES = ("log_event", "calculate_total_time", "extract_event", "merge_logs", "generate_summary_report")
+FORMATS = ("txt", "csv", "json", "jsonl", "bin")
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of a list of samples."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(1, int(round(fraction * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def peak_rss_kb():
+    """Peak resident set size of the current process in KiB, or None if unknown."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # macOS reports bytes
+
+
+def _time_calls(calls):
+    """Runs each zero-argument callable once and returns per-call latencies in seconds."""
+    latencies = []
+    for call in calls:
+        started = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def _run_case(case, file_format, locations, events_per_location, workdir):
+    """
+    Runs one benchmark case and returns (operations, events, latencies).
+
+    ``events`` is the number of events the timed calls wrote or read, or None
+    for extract_event, whose indexed lookups read a few entries whatever the
+    log size (only its operations per second are meaningful).
+    """
+    log_dir = os.path.join(workdir, "logs")
+
+    if case == "log_event":
+        # Write the same number of events through the public write path
+        names = datagen.location_names(locations)
+        calls = [
+            (lambda name=name, index=index: evlog.log_event(
+                name, "Departure" if index % 2 else "Arrival", file_format, log_dir))
+            for index in range(events_per_location) for name in names
+        ]
+        latencies = _time_calls(calls)
+        return len(calls), len(calls), latencies
+
+    names = datagen.generate_log_dir(log_dir, locations, events_per_location, file_format)
+    total_events = locations * events_per_location
+
+    if case == "calculate_total_time":
+        calls = [
+            (lambda name=name: evlog.calculate_total_time(name, file_format, log_dir, write_summary=False))
+            for name in names
+        ]
+        return len(calls), total_events, _time_calls(calls)
+
+    if case == "extract_event":
+        calls = [
+            (lambda name=name: evlog.extract_event(name, "action", "Arrival", log_dir, file_format))
+            for name in names
+        ]
+        return len(calls), None, _time_calls(calls)
+
+    if case == "merge_logs":
+        latencies = _time_calls([lambda: evlog.merge_logs(names, file_format, log_dir)])
+        return 1, total_events, latencies
+
+    if case == "generate_summary_report":
+        latencies = _time_calls([lambda: evlog.generate_summary_report(log_dir, file_format, read_only=True)])
+        return 1, total_events, latencies
+
+    raise ValueError(f"Unknown benchmark case: {case}")
+
+
+def run_case(case, file_format, locations, events_per_location):
+    """Runs one case in a temporary directory and summarizes it as a result dict."""
+    workdir = tempfile.mkdtemp(prefix="evlog-bench-")
+    # Keep evlog's own diagnostics out of the caller's working directory
+    evlog.configure(log_file=os.path.join(workdir, "evlog.log"))
+    try:
+        operations, events, latencies = _run_case(case, file_format, locations, events_per_location, workdir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    seconds = sum(latencies)
+    return {
+        "case": case,
+        "format": file_format,
+        "locations": locations,
+        "events_per_location": events_per_location,
+        "operations": operations,
+        "events": events,
+        "seconds": seconds,
+        "ops_per_sec": operations / seconds if seconds else None,
+        "events_per_sec": events / seconds if events is not None and seconds else None,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "peak_rss_kb": peak_rss_kb(),
+    }
+
+
+def _child(connection, args):
+    try:
+        connection.send(("ok", run_case(*args)))
+    except Exception as e:  # Report the failure instead of hanging the parent
+        connection.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        connection.close()
+
+
+def run_isolated(case, file_format, locations, events_per_location):
+    """Runs a case in a child process so its peak RSS is its own."""
+    context = multiprocessing.get_context("spawn")
+    parent, child = context.Pipe(duplex=False)
+    process = context.Process(target=_child, args=(child, (case, file_format, locations, events_per_location)))
+    process.start()
+    child.close()
+    status, payload = parent.recv()
+    process.join()
+
+    if status != "ok":
+        return {"case": case, "format": file_format, "error": payload}
+    return payload
+
+
+def run_suite(cases=CASES, formats=FORMATS, locations=10, events_per_location=1000, isolate=True):
+    """
+    Runs every (case, format) combination.
+
+    Returns:
+        dict: Machine-readable report with environment details and one result per combination.
+    """
+    runner = run_isolated if isolate else run_case
+    results = [
+        runner(case, file_format, locations, events_per_location)
+        for case in cases for file_format in formats
+    ]
+
+    return {
+        "evlog_version": evlog.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "parameters": {
+            "locations": locations,
+            "events_per_location": events_per_location,
+            "cases": list(cases),
+            "formats": list(formats),
+            "isolated": isolate,
+        },
+        "results": results,
+    }
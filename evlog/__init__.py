@@ -1,9 +1,62 @@
-from .logger import log_event
-from .logger import calculate_total_time
-from .logger import extract_event
-from .logger import merge_logs
-from .logger import generate_summary_report
-from .logger import cleanup_old_logs
+"""
+evlog - event logging for Python.
+
+Public names are imported on first access (PEP 562), so ``import evlog`` does
+not load the logger, asyncio or NumPy until they are used.
+"""
+import importlib
 
 __version__ = "0.0.4"
 __author__ = "Kyle May"
+
+# Public name -> (module, attribute)
+_EXPORTS = {
+    "log_event": (".logger", "log_event"),
+    "EventLogger": (".logger", "EventLogger"),
+    "calculate_total_time": (".logger", "calculate_total_time"),
+    "calculate_group_totals": (".logger", "calculate_group_totals"),
+    "extract_event": (".logger", "extract_event"),
+    "query_events": (".logger", "query_events"),
+    "rebuild_index": (".logger", "rebuild_index"),
+    "merge_logs": (".logger", "merge_logs"),
+    "generate_summary_report": (".logger", "generate_summary_report"),
+    "cleanup_old_logs": (".logger", "cleanup_old_logs"),
+    "migrate_json_to_jsonl": (".logger", "migrate_json_to_jsonl"),
+    "convert_log": (".logger", "convert_log"),
+    "configure": (".logger", "configure"),
+    "get_log_dir": (".logger", "get_log_dir"),
+    "enable_async_logging": (".logger", "enable_async_logging"),
+    "disable_async_logging": (".logger", "disable_async_logging"),
+    "enable_file_locking": (".logger", "enable_file_locking"),
+    "disable_file_locking": (".logger", "disable_file_locking"),
+    "lock_stats": (".logger", "lock_stats"),
+    "configure_cache": (".logger", "configure_cache"),
+    "cache_stats": (".logger", "cache_stats"),
+    "clear_cache": (".logger", "clear_cache"),
+    "AsyncEventWriter": (".async_writer", "AsyncEventWriter"),
+    "alog_event": (".async_writer", "alog_event"),
+    "enable_metrics": (".metrics", "enable"),
+    "disable_metrics": (".metrics", "disable"),
+    "get_metrics": (".metrics", "snapshot"),
+    "reset_metrics": (".metrics", "reset"),
+    "profile": (".metrics", "profile"),
+    "InMemorySink": (".metrics", "InMemorySink"),
+    "PrometheusFileSink": (".metrics", "PrometheusFileSink"),
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,113 @@
+"""
+Pairing and aggregation of event timestamps.
+
+Events are paired positionally (1st with 2nd, 3rd with 4th, ...) and durations
+are summed in integer epoch seconds. When NumPy is installed, large inputs are
+loaded into an int64 array and paired with array slicing; otherwise a
+pure-Python path gives the same results.
+"""
+from datetime import date
+
+# NumPy is optional and imported on first use, so importing evlog stays cheap
+np = None
+_numpy_checked = False
+
+GROUP_BY_OPTIONS = ("day", "week", "action")
+
+# Below this many events, converting the list to an array costs more than it saves
+NUMPY_MIN_EVENTS = 512
+
+_UNIX_EPOCH_ORDINAL = 719163  # date(1970, 1, 1).toordinal()
+
+
+def _use_numpy(event_times):
+    global np, _numpy_checked
+    if len(event_times) < NUMPY_MIN_EVENTS:
+        return False
+    if not _numpy_checked:
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            pass
+        _numpy_checked = True
+    return np is not None
+
+
+def paired_total(event_times):
+    """
+    Returns the summed duration in seconds of the paired events.
+
+    A trailing unpaired event is ignored.
+    """
+    paired_len = len(event_times) - len(event_times) % 2
+
+    if _use_numpy(event_times):
+        times = np.asarray(event_times, dtype=np.int64)[:paired_len]
+        return int((times[1::2] - times[0::2]).sum())
+
+    return sum(event_times[1:paired_len:2]) - sum(event_times[0:paired_len:2])
+
+
+def _day_label(day):
+    return date.fromordinal(day + _UNIX_EPOCH_ORDINAL).isoformat()
+
+
+def _week_label(day):
+    iso_year, iso_week, _ = date.fromordinal(day + _UNIX_EPOCH_ORDINAL).isocalendar()
+    return f"{iso_year}-W{iso_week:02d}"
+
+
+def group_totals(event_times, by="day", actions=None):
+    """
+    Sums paired durations per group in a single pass.
+
+    Parameters:
+        event_times (list): Event times in epoch seconds, in log order.
+        by (str): "day" or "week" (of the opening event) or "action" (the opening event's action).
+        actions (list, optional): Action of each event; required when grouping by action.
+
+    Returns:
+        dict: Group label to total seconds, ordered by label.
+    """
+    if by not in GROUP_BY_OPTIONS:
+        raise ValueError(f"Unsupported group_by option: {by}")
+    if by == "action" and (actions is None or len(actions) != len(event_times)):
+        raise ValueError("Grouping by action requires one action per event")
+
+    paired_len = len(event_times) - len(event_times) % 2
+
+    if _use_numpy(event_times):
+        times = np.asarray(event_times, dtype=np.int64)[:paired_len]
+        starts = times[0::2]
+        durations = times[1::2] - starts
+
+        if by == "action":
+            keys = np.asarray(actions[0:paired_len:2], dtype=object)
+        else:
+            keys = starts // 86400
+            if by == "week":
+                keys = keys - (keys + 3) % 7  # Monday of the ISO week (1970-01-01 was a Thursday)
+
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        sums = np.zeros(len(unique_keys), dtype=np.int64)
+        np.add.at(sums, inverse, durations)
+        grouped = zip(unique_keys.tolist(), sums.tolist())
+    else:
+        totals = {}
+        for index in range(0, paired_len, 2):
+            start = event_times[index]
+            if by == "action":
+                key = actions[index]
+            else:
+                key = start // 86400
+                if by == "week":
+                    key -= (key + 3) % 7
+            totals[key] = totals.get(key, 0) + event_times[index + 1] - start
+        grouped = sorted(totals.items())
+
+    if by == "day":
+        return {_day_label(key): total for key, total in grouped}
+    elif by == "week":
+        return {_week_label(key): total for key, total in grouped}
+    return dict(grouped)
@@ -0,0 +1,202 @@
+import atexit
+import asyncio
+import functools
+import threading
+from collections import deque
+
+from .logger import SUPPORTED_FORMATS, EventLogger, _current_timestamp, _log_dir, log, log_event
+from . import logger as _logger
+from . import metrics
+
+BACKPRESSURE_MODES = ("block", "drop_oldest", "drop_newest")
+
+
+class AsyncEventWriter:
+    """
+    Accepts events on a bounded in-memory queue and writes them from a
+    dedicated background thread, so callers never wait on disk I/O.
+
+    Parameters:
+        log_dir (str): Default directory for log files (default: evlog.get_log_dir()).
+        maxsize (int): Maximum number of queued events.
+        backpressure (str): What to do when the queue is full:
+            "block" waits for room, "drop_oldest" discards the oldest queued event,
+            "drop_newest" discards the event being submitted.
+        batch_size (int): Maximum number of events the writer thread takes per batch.
+        flush_interval (float): Seconds the underlying EventLogger may keep events buffered.
+    """
+
+    def __init__(self, log_dir=None, maxsize=10000, backpressure="block", batch_size=500, flush_interval=1.0):
+        if backpressure not in BACKPRESSURE_MODES:
+            raise ValueError(f"Unsupported backpressure mode: {backpressure}")
+
+        self.log_dir = _log_dir(log_dir)
+        self.maxsize = max(1, maxsize)
+        self.backpressure = backpressure
+        self.batch_size = max(1, batch_size)
+
+        self.submitted = 0
+        self.written = 0
+        self.dropped_oldest = 0
+        self.dropped_newest = 0
+
+        self._queue = deque()
+        self._in_flight = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._event_logger = EventLogger(self.log_dir, batch_size=batch_size, flush_interval=flush_interval)
+
+        self._thread = threading.Thread(target=self._run, name="evlog-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    @property
+    def dropped(self):
+        """Total number of events discarded because the queue was full."""
+        return self.dropped_oldest + self.dropped_newest
+
+    def stats(self):
+        """Returns a snapshot of the queue counters."""
+        with self._condition:
+            return {
+                "queued": len(self._queue),
+                "submitted": self.submitted,
+                "written": self.written,
+                "dropped_oldest": self.dropped_oldest,
+                "dropped_newest": self.dropped_newest,
+            }
+
+    def submit(self, location: str, action: str, file_format="txt", log_dir=None, timestamp=None, block=True, timestamp_format="text",
+               partition=None):
+        """
+        Queues an event for the writer thread, stamped with the current time in
+        ``timestamp_format`` unless ``timestamp`` is given.
+
+        With the "block" backpressure mode and ``block=False`` a full queue
+        returns immediately instead of waiting (the event is not counted as dropped).
+
+        Returns:
+            bool: True if the event was queued, False if it was rejected.
+        """
+        if file_format not in SUPPORTED_FORMATS:
+            log.error("Unsupported file format: %s", file_format)
+            return False
+
+        if timestamp is None:
+            timestamp = _current_timestamp(timestamp_format)
+
+        event = (location, action, file_format, log_dir or self.log_dir, timestamp, partition)
+
+        with self._condition:
+            if self._closed:
+                log.error("Async writer is closed, dropping event for %s", location)
+                return False
+
+            if len(self._queue) >= self.maxsize:
+                if self.backpressure == "drop_newest":
+                    self.dropped_newest += 1
+                    metrics.inc("evlog_async_dropped_total", policy="drop_newest")
+                    return False
+                elif self.backpressure == "drop_oldest":
+                    self._queue.popleft()
+                    self.dropped_oldest += 1
+                    metrics.inc("evlog_async_dropped_total", policy="drop_oldest")
+                elif not block:
+                    return False
+                else:
+                    while len(self._queue) >= self.maxsize and not self._closed:
+                        self._condition.wait()
+                    if self._closed:
+                        return False
+
+            self._queue.append(event)
+            self.submitted += 1
+            self._condition.notify_all()
+            return True
+
+    def wait(self, timeout=None):
+        """
+        Blocks until every queued event has been handed to the file backends.
+
+        Returns:
+            bool: False if the timeout expired first.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._queue and not self._in_flight, timeout)
+
+    def flush(self, timeout=None):
+        """
+        Blocks until every queued event has been written to disk.
+
+        Returns:
+            bool: False if the timeout expired first.
+        """
+        if not self.wait(timeout):
+            return False
+        self._event_logger.flush()
+        return True
+
+    def close(self, timeout=None):
+        """Stops accepting events, drains the queue and closes the underlying files."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+
+        self._thread.join(timeout)
+        self._event_logger.close()
+        atexit.unregister(self.close)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+
+                if not self._queue:
+                    return  # Closed and fully drained
+
+                batch_len = min(self.batch_size, len(self._queue))
+                batch = [self._queue.popleft() for _ in range(batch_len)]
+                self._in_flight = batch_len
+                self._condition.notify_all()  # Wake producers waiting for room
+
+            for location, action, file_format, log_dir, timestamp, partition in batch:
+                self._event_logger.log(location, action, file_format, log_dir, timestamp, partition=partition)
+
+            with self._condition:
+                self.written += batch_len
+                self._in_flight = 0
+                idle = not self._queue
+
+            if idle:
+                self._event_logger.flush()
+
+            with self._condition:
+                self._condition.notify_all()
+
+
+async def alog_event(location: str, action: str, file_format="txt", log_dir=None, timestamp_format="text",
+                     partition=None):
+    """
+    Coroutine counterpart of log_event that never blocks the event loop.
+
+    With asynchronous logging enabled the event is queued directly; if the queue
+    is full in "block" mode, or asynchronous logging is disabled, the write runs
+    in the loop's default executor.
+    """
+    timestamp = _current_timestamp(timestamp_format)
+    writer = _logger.get_async_writer()
+
+    if writer is not None:
+        if writer.submit(location, action, file_format, log_dir, timestamp, block=False, partition=partition):
+            return
+        if writer.backpressure != "block":
+            return  # Dropped according to the backpressure policy
+        call = functools.partial(writer.submit, location, action, file_format, log_dir, timestamp, partition=partition)
+    else:
+        call = functools.partial(log_event, location, action, file_format, log_dir, timestamp_format, partition)
+
+    loop = asyncio.get_event_loop()
+    await loop.run_in_executor(None, call)
@@ -0,0 +1,270 @@
+"""
+Fixed-width binary record storage for the "bin" log format.
+
+Each record is 24 little-endian bytes:
+
+    epoch        int64   event time in epoch seconds (local wall-clock, see timestamp_to_epoch)
+    value        int64   total seconds for summary records, 0 for events
+    action_id    uint32  index into the file's name dictionary (SUMMARY_ACTION_ID for summaries)
+    location_id  uint32  index into the file's name dictionary
+
+Names are interned in a ``<log file>.names`` sidecar holding one JSON string
+per line; a name's id is its line number. Files are read through ``mmap`` and
+``memoryview`` casts, so scanning a column needs no per-record parsing.
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+
+RECORD = struct.Struct("<qqII")
+RECORD_SIZE = RECORD.size
+SUMMARY_ACTION_ID = 0xFFFFFFFF
+
+# Byte offset of action_id within a record, and its encoding in summary records
+_ACTION_ID_OFFSET = 16
+_SUMMARY_ACTION_BYTES = struct.pack("<I", SUMMARY_ACTION_ID)
+
+# Array typecode of each column
+_COLUMN_TYPES = {"epochs": "q", "values": "q", "action_ids": "I", "location_ids": "I"}
+
+# memoryview.cast uses native byte order, which matches the file only on little-endian hosts
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def names_path(log_file):
+    return log_file + ".names"
+
+
+class NameDictionary:
+    """Append-only string interning table stored next to a binary log."""
+
+    def __init__(self, path):
+        self.path = path
+        self.names = []
+        self.ids = {}
+        self._size = 0
+        self.refresh()
+
+    def refresh(self):
+        """Loads names appended to the sidecar since the last read (e.g. by another process)."""
+        try:
+            with open(self.path, "rb") as file:
+                file.seek(self._size)
+                for raw_line in file:
+                    if not raw_line.endswith(b"\n"):
+                        break
+                    self._size += len(raw_line)
+                    name = json.loads(raw_line)
+                    self.ids.setdefault(name, len(self.names))
+                    self.names.append(name)
+        except FileNotFoundError:
+            pass
+
+    def intern(self, name):
+        """Returns the id of ``name``, adding it to the sidecar if it is new."""
+        name_id = self.ids.get(name)
+        if name_id is not None:
+            return name_id
+
+        self.refresh()
+        name_id = self.ids.get(name)
+        if name_id is not None:
+            return name_id
+
+        line = (json.dumps(name) + "\n").encode("utf-8")
+        with open(self.path, "ab") as file:
+            file.write(line)
+        self._size += len(line)
+
+        name_id = len(self.names)
+        self.ids[name] = name_id
+        self.names.append(name)
+        return name_id
+
+    def name(self, name_id):
+        """Returns the name for an id, or None if it is unknown."""
+        if name_id >= len(self.names):
+            self.refresh()
+        if name_id < len(self.names):
+            return self.names[name_id]
+        return None
+
+
+def pack_records(records):
+    """Packs (epoch, value, action_id, location_id) tuples into bytes."""
+    return b"".join(RECORD.pack(*record) for record in records)
+
+
+class RecordView:
+    """
+    Read-only columnar view of a binary log from byte offset ``start``.
+
+    ``epochs``, ``values``, ``action_ids`` and ``location_ids`` are strided
+    memoryviews over the mapped file (plain lists on big-endian hosts). A
+    partially written trailing record is ignored. Use as a context manager so
+    the mapping is released.
+    """
+
+    def __init__(self, log_file, start=0):
+        self.start = start
+        self.end = start
+        self._mmap = None
+        self._views = []
+        self.epochs = self.values = self.action_ids = self.location_ids = ()
+
+        with open(log_file, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            usable = (size - start) - (size - start) % RECORD_SIZE
+            if usable <= 0:
+                return
+            self.end = start + usable
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        data = memoryview(self._mmap)[start:self.end]
+        self._views.append(data)
+
+        if _NATIVE_LITTLE_ENDIAN:
+            int64s = data.cast("q")
+            uint32s = data.cast("I")
+            self._views.extend((int64s, uint32s))
+            self.epochs = int64s[0::3]
+            self.values = int64s[1::3]
+            self.action_ids = uint32s[4::6]
+            self.location_ids = uint32s[5::6]
+            self._views.extend((self.epochs, self.values, self.action_ids, self.location_ids))
+        else:
+            columns = list(zip(*RECORD.iter_unpack(data))) or [(), (), (), ()]
+            self.epochs, self.values, self.action_ids, self.location_ids = (list(column) for column in columns)
+
+    def __len__(self):
+        return (self.end - self.start) // RECORD_SIZE
+
+    def summary_positions(self):
+        """Returns the record numbers of summary records, found with a byte search of the mapping."""
+        positions = []
+        if self._mmap is None:
+            return positions
+
+        offset = self._mmap.find(_SUMMARY_ACTION_BYTES, self.start, self.end)
+        while offset != -1:
+            record, field_offset = divmod(offset - self.start, RECORD_SIZE)
+            if field_offset == _ACTION_ID_OFFSET:
+                positions.append(record)
+                offset = self._mmap.find(_SUMMARY_ACTION_BYTES, self.start + (record + 1) * RECORD_SIZE, self.end)
+            else:
+                offset = self._mmap.find(_SUMMARY_ACTION_BYTES, offset + 1, self.end)
+        return positions
+
+    def column(self, name, skip=()):
+        """
+        Copies a column into an ``array``, leaving out the record numbers in
+        ``skip`` (ascending). Runs between skipped records are copied in bulk.
+        """
+        values = array(_COLUMN_TYPES[name])
+        view = getattr(self, name)
+        previous = 0
+        for stop in list(skip) + [len(self)]:
+            if stop > previous:
+                if _NATIVE_LITTLE_ENDIAN:
+                    values.frombytes(view[previous:stop].tobytes())
+                else:
+                    values.extend(view[previous:stop])
+            previous = stop + 1
+        return values
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self.epochs = self.values = self.action_ids = self.location_ids = ()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+def iter_records_reverse(log_file, chunk_records=4096):
+    """Yields (offset, epoch, value, action_id, location_id) from the last record to the first."""
+    with open(log_file, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        end = size - size % RECORD_SIZE
+
+        while end > 0:
+            start = max(0, end - chunk_records * RECORD_SIZE)
+            file.seek(start)
+            chunk = file.read(end - start)
+            for position in range(len(chunk) - RECORD_SIZE, -1, -RECORD_SIZE):
+                yield (start + position,) + RECORD.unpack_from(chunk, position)
+            end = start
+
+
+def sync_file(file):
+    """Flushes an open file to disk, so a rename that follows never exposes a partly written file after a crash."""
+    file.flush()
+    os.fsync(file.fileno())
+
+
+def sync_directory(path):
+    """Flushes the directory holding ``path``, making a rename into it durable (a no-op on Windows)."""
+    if os.name == "nt":
+        return
+    fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_file(log_file, entries):
+    """
+    Writes (location, action, epoch) events to a new binary log and its name
+    dictionary, replacing any existing file once everything is written.
+
+    Returns:
+        int: Number of records written.
+    """
+    temp_file = f"{log_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+    temp_names = names_path(temp_file)
+    for path in (temp_file, temp_names):
+        if os.path.exists(path):
+            os.remove(path)
+
+    try:
+        open(temp_names, "wb").close()  # An empty log still gets its (empty) dictionary
+        names = NameDictionary(temp_names)
+        count = 0
+
+        with open(temp_file, "wb") as file:
+            batch = []
+            for location, action, epoch in entries:
+                batch.append((epoch, 0, names.intern(action), names.intern(location)))
+                if len(batch) >= 4096:
+                    file.write(pack_records(batch))
+                    count += len(batch)
+                    batch = []
+            file.write(pack_records(batch))
+            count += len(batch)
+            sync_file(file)
+
+        with open(temp_names, "rb") as file:
+            os.fsync(file.fileno())
+
+        # The dictionary must be in place before records that refer to it
+        os.replace(temp_names, names_path(log_file))
+        os.replace(temp_file, log_file)
+        sync_directory(log_file)
+    except BaseException:
+        for path in (temp_file, temp_names):
+            if os.path.exists(path):
+                os.remove(path)
+        raise
+    return count
@@ -0,0 +1,195 @@
+"""
+In-process LRU cache of parsed log files.
+
+Each entry holds the events of one log file as parallel columns (epoch
+seconds, location, action, timestamp text) together with the latest summary
+row, keyed by the file's path and validated against its inode, size and
+modification time. The cache is bounded by an estimated memory size; the least
+recently used files are evicted first.
+"""
+import threading
+from collections import OrderedDict
+from itertools import islice
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# Estimated cost of one cached event: list slots, the epoch int and the timestamp
+# string. Locations and actions are shared strings and are not counted per event.
+EVENT_BYTES = 136
+ENTRY_BYTES = 512
+
+
+def stat_key(stat):
+    """Returns the validation key of a file from its os.stat() result."""
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+class ParsedLog:
+    """
+    The parsed events of one log file.
+
+    ``position`` is the byte offset just after the last parsed line, so a
+    file that was only appended to can be extended instead of re-parsed.
+    ``head`` and ``tail`` are the bytes of the first and last parsed lines,
+    re-read before extending to tell an append from a rewrite.
+    Columns only grow; readers that need them aligned should stop at ``count``.
+    """
+
+    __slots__ = ("epochs", "locations", "actions", "timestamps", "summary", "position", "count", "head", "tail")
+
+    def __init__(self):
+        self.epochs = []
+        self.locations = []
+        self.actions = []
+        self.timestamps = []
+        self.summary = None
+        self.position = 0
+        self.count = 0
+        self.head = None
+        self.tail = None
+
+    @property
+    def nbytes(self):
+        return ENTRY_BYTES + self.count * EVENT_BYTES
+
+    def append(self, epoch, location, action, timestamp):
+        self.epochs.append(epoch)
+        self.locations.append(location)
+        self.actions.append(action)
+        self.timestamps.append(timestamp)
+
+    def entries(self):
+        """Returns (epoch, (location, action, timestamp)) pairs in log order."""
+        count = self.count
+        return zip(islice(self.epochs, count),
+                   zip(islice(self.locations, count), islice(self.actions, count), islice(self.timestamps, count)))
+
+
+class EventCache:
+    """
+    Thread-safe LRU mapping of log file paths to (key, ParsedLog).
+
+    Parameters:
+        max_bytes (int): Estimated memory budget; 0 disables caching.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max(0, max_bytes)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.extends = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, path):
+        return path in self._entries
+
+    def get(self, path, key):
+        """Returns the cached ParsedLog if its key still matches, counting a hit or miss."""
+        with self._lock:
+            item = self._entries.get(path)
+            if item is not None and item[0] == key:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return item[1]
+            self.misses += 1
+            return None
+
+    def peek(self, path):
+        """Returns (key, ParsedLog) for a path without touching the counters or LRU order."""
+        with self._lock:
+            return self._entries.get(path)
+
+    def put(self, path, key, parsed):
+        """Stores a ParsedLog, evicting the least recently used files to stay within budget."""
+        with self._lock:
+            self._discard(path)
+            if parsed.nbytes > self.max_bytes:
+                return
+            self._entries[path] = (key, parsed)
+            self.nbytes += parsed.nbytes
+            self._evict()
+
+    def extend(self, path, previous_key, key, rows=(), summary=None, position=None, tail=None):
+        """
+        Records events appended by a writer: if the cached entry matches the file
+        as it was before the write, the rows are added and the key moves on;
+        otherwise the entry is dropped.
+
+        Parameters:
+            rows (iterable): (epoch, location, action, timestamp) tuples that were written.
+            summary (dict, optional): A summary entry that was written.
+            position (int, optional): Byte offset parsed up to (default: the new file size).
+            tail (bytes, optional): The last line written, ending at ``position``.
+        """
+        with self._lock:
+            item = self._entries.get(path)
+            if item is None:
+                return
+            if item[0] != previous_key:
+                self._discard(path)
+                self.invalidations += 1
+                return
+
+            parsed = item[1]
+            previous_bytes = parsed.nbytes
+            for row in rows:
+                parsed.append(*row)
+            parsed.count = len(parsed.epochs)
+            if summary is not None:
+                parsed.summary = summary
+            parsed.position = key[1] if position is None else position
+            parsed.tail = tail
+
+            self._entries[path] = (key, parsed)
+            self.nbytes += parsed.nbytes - previous_bytes
+            self.extends += 1
+            self._evict()
+
+    def invalidate(self, path):
+        """Drops the entry for a file that was rewritten, moved or deleted."""
+        with self._lock:
+            if self._discard(path):
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def resize(self, max_bytes):
+        with self._lock:
+            self.max_bytes = max(0, max_bytes)
+            self._evict()
+
+    def stats(self):
+        """Returns a snapshot of the cache counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "extends": self.extends,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "files": len(self._entries),
+                "bytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _discard(self, path):
+        item = self._entries.pop(path, None)
+        if item is None:
+            return False
+        self.nbytes -= item[1].nbytes
+        return True
+
+    def _evict(self):
+        while self.nbytes > self.max_bytes and self._entries:
+            _, (_, parsed) = self._entries.popitem(last=False)
+            self.nbytes -= parsed.nbytes
+            self.evictions += 1
@@ -1,392 +1,2547 @@
 import os
+import io
+import re
 import json
 import csv
+import time
+import atexit
+import calendar
 import logging
+import threading
+import weakref
+import heapq
+import functools
+import contextlib
+from collections import OrderedDict
 from datetime import datetime, timedelta
 
-# Default Log Directory
-DEFAULT_LOG_DIR = os.path.join(os.getcwd(), "logs")
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; file locking becomes a no-op
+    fcntl = None
+
+from . import binstore, metrics
+from .cache import DEFAULT_MAX_BYTES, EventCache, ParsedLog, stat_key
+from .aggregate import group_totals, paired_total
+
+### --- Configuration --- ###
+# Nothing is created or configured at import time. The log directory defaults to
+# "logs" under the working directory at the time of use; configure() and the
+# EVLOG_* environment variables override it and the other startup options.
+ENV_LOG_DIR = "EVLOG_LOG_DIR"
+ENV_LOG_FILE = "EVLOG_LOG_FILE"
+ENV_FILE_LOCKING = "EVLOG_FILE_LOCKING"
+ENV_CACHE_MAX_BYTES = "EVLOG_CACHE_MAX_BYTES"
+ENV_METRICS = "EVLOG_METRICS"
+
+_settings = {"log_dir": None, "log_file": None}
+_initialized = False
+_log_handlers = []  # Handlers setup_logger() added to the root logger
+_init_lock = threading.RLock()
+
+def _env_flag(name):
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+def configure(log_dir=None, log_file=None, file_locking=None, cache_max_bytes=None, metrics_enabled=None):
+    """
+    Sets evlog's defaults explicitly; arguments left as None keep their current value.
+
+    Parameters:
+        log_dir (str): Default directory for log files (env: EVLOG_LOG_DIR; default: ./logs at the time of use).
+        log_file (str): File receiving evlog's own diagnostics, or "" to leave logging unconfigured
+            (env: EVLOG_LOG_FILE; default: <log_dir>/evlog.log, set up when the first message is emitted).
+        file_locking (bool): See enable_file_locking (env: EVLOG_FILE_LOCKING=1).
+        cache_max_bytes (int): See configure_cache (env: EVLOG_CACHE_MAX_BYTES).
+        metrics_enabled (bool): Collect metrics, see evlog.metrics.enable (env: EVLOG_METRICS=1).
+    """
+    _initialize()
+
+    with _init_lock:
+        if log_dir is not None:
+            _settings["log_dir"] = log_dir
+        if log_file is not None:
+            _settings["log_file"] = log_file
+        if log_dir is not None or log_file is not None:
+            _reset_logger()
+    if file_locking is not None:
+        enable_file_locking() if file_locking else disable_file_locking()
+    if cache_max_bytes is not None:
+        configure_cache(cache_max_bytes)
+    if metrics_enabled is not None:
+        metrics.enable() if metrics_enabled else metrics.disable()
+
+def _initialize():
+    """Applies the EVLOG_* environment variables once, on first use of the package."""
+    global _initialized
+    if _initialized:
+        return
+
+    with _init_lock:
+        if _initialized:
+            return
+        _initialized = True
+
+        if _settings["log_dir"] is None and os.environ.get(ENV_LOG_DIR):
+            _settings["log_dir"] = os.environ[ENV_LOG_DIR]
+        if _settings["log_file"] is None and ENV_LOG_FILE in os.environ:
+            _settings["log_file"] = os.environ[ENV_LOG_FILE]
+        if _env_flag(ENV_FILE_LOCKING):
+            enable_file_locking()
+        if os.environ.get(ENV_CACHE_MAX_BYTES):
+            configure_cache(int(os.environ[ENV_CACHE_MAX_BYTES]))
+        if _env_flag(ENV_METRICS):
+            metrics.enable()
+
+def get_log_dir():
+    """Returns the default log directory currently in effect."""
+    _initialize()
+    return _settings["log_dir"] or os.path.join(os.getcwd(), "logs")
+
+def _log_dir(log_dir):
+    """Resolves a ``log_dir`` argument, None meaning the configured default."""
+    if log_dir is None:
+        return get_log_dir()
+    _initialize()
+    return log_dir
+
+def __getattr__(name):
+    # DEFAULT_LOG_DIR used to be a constant frozen at import; it now follows configure()
+    if name == "DEFAULT_LOG_DIR":
+        return get_log_dir()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Function to set up logging dynamically
-def setup_logger(log_dir=DEFAULT_LOG_DIR):
+def setup_logger(log_dir=None):
     """
     Sets up a logger for tracking log events.
     """
-    os.makedirs(log_dir, exist_ok=True)  # Ensure the directory exists
-    log_file = os.path.join(log_dir, "evlog.log")
-
-    logging.basicConfig(
-        filename=log_file,
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-    )
+    log_dir = _log_dir(log_dir)
+    log_file = _settings["log_file"]
+    if log_file is None:
+        os.makedirs(log_dir, exist_ok=True)  # Ensure the directory exists
+        log_file = os.path.join(log_dir, "evlog.log")
+
+    if log_file:
+        root = logging.getLogger()
+        existing = list(root.handlers)
+        logging.basicConfig(
+            filename=log_file,
+            level=logging.INFO,
+            format="%(asctime)s - %(levelname)s - %(message)s",
+        )
+        _log_handlers.extend(handler for handler in root.handlers if handler not in existing)
 
     return logging.getLogger(__name__)
 
-# Initialize the global logger
-log = setup_logger()
+def _reset_logger():
+    """
+    Removes the handler setup_logger() installed, so the next message sets
+    logging up again for the current settings. Logging configured by the
+    application itself is left alone.
+    """
+    root = logging.getLogger()
+    for handler in _log_handlers:
+        root.removeHandler(handler)
+        handler.close()
+    _log_handlers.clear()
+    _DeferredLogger._logger = None
+
+class _DeferredLogger:
+    """
+    Stands in for the module logger and calls setup_logger() when the first
+    message is emitted, so importing evlog touches neither the filesystem nor
+    the logging configuration.
+    """
 
+    _logger = None
 
-### --- TXT Log Functions --- ###
-def log_event_txt(location: str, action: str, log_dir=DEFAULT_LOG_DIR):
-    """Logs an event in a TXT file."""
-    os.makedirs(log_dir, exist_ok=True)
-    log_file = os.path.join(log_dir, f"{location}_Tracking.txt")
+    def __getattr__(self, name):
+        logger = self._logger
+        if logger is None:
+            with _init_lock:
+                logger = self._logger
+                if logger is None:
+                    logger = _DeferredLogger._logger = setup_logger()
+        return getattr(logger, name)
 
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+# Initialize the global logger (set up lazily, see _DeferredLogger)
+log = _DeferredLogger()
 
-    try:
-        with open(log_file, "a") as file:
-            file.write(f"{action} logged to {location}: {current_time}\n")
-    except Exception as e:
-        log.error(f"Error writing to TXT log: {e}")
 
-def calculate_total_time_txt(location: str, log_dir=DEFAULT_LOG_DIR):
-    """Calculates total time from TXT log format and appends it to the same TXT file."""
-    log_file = os.path.join(log_dir, f"{location}_Tracking.txt")
+### --- Timestamp Helpers --- ###
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+TIMESTAMP_FORMATS = ("text", "epoch")
 
-    if not os.path.exists(log_file):
-        log.warning(f"TXT log file not found: {log_file}")
-        return None
+_UNIX_EPOCH_ORDINAL = 719163  # date(1970, 1, 1).toordinal()
+_day_cache = {}
+_last_timestamp = (None, "")
+
+def timestamp_to_epoch(value):
+    """
+    Converts a stored timestamp to integer seconds on the local wall clock since
+    1970-01-01 00:00:00, without building a datetime. This is the clock text
+    timestamps are written in, so events are ordered and paired on it.
+
+    Accepts "%Y-%m-%d %H:%M:%S" strings and Unix epoch seconds (int or digit
+    string, as stored with ``timestamp_format="epoch"``), which are converted to
+    local time, so both kinds can be mixed in one log.
+
+    Raises:
+        ValueError: If the value is not a valid timestamp.
+    """
+    if isinstance(value, int):
+        return calendar.timegm(time.localtime(value))
+    if value.isascii() and value.isdigit():
+        return calendar.timegm(time.localtime(int(value)))
+
+    if len(value) != 19 or value[4] != "-" or value[7] != "-" or value[10] != " " or value[13] != ":" or value[16] != ":":
+        raise ValueError(f"time data {value!r} does not match format {TIMESTAMP_FORMAT!r}")
+    digits = value[:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16] + value[17:19]
+    if not (digits.isascii() and digits.isdigit()):
+        raise ValueError(f"time data {value!r} does not match format {TIMESTAMP_FORMAT!r}")
+
+    day = value[:10]
+    day_start = _day_cache.get(day)
+    if day_start is None:
+        day_start = (datetime(int(day[:4]), int(day[5:7]), int(day[8:10])).toordinal() - _UNIX_EPOCH_ORDINAL) * 86400
+        if len(_day_cache) >= 4096:
+            _day_cache.clear()
+        _day_cache[day] = day_start
+
+    hour, minute, second = int(value[11:13]), int(value[14:16]), int(value[17:19])
+    if hour > 23 or minute > 59 or second > 59:
+        raise ValueError(f"time data {value!r} does not match format {TIMESTAMP_FORMAT!r}")
+
+    return day_start + hour * 3600 + minute * 60 + second
+
+def parse_timestamp(value):
+    """Parses a stored timestamp (text or epoch seconds) into a naive local datetime."""
+    return datetime(1970, 1, 1) + timedelta(seconds=timestamp_to_epoch(value))
+
+def format_timestamp(epoch):
+    """Formats local wall-clock seconds (as returned by timestamp_to_epoch) as "%Y-%m-%d %H:%M:%S"."""
+    return (datetime(1970, 1, 1) + timedelta(seconds=epoch)).strftime(TIMESTAMP_FORMAT)
+
+def _current_timestamp(timestamp_format="text"):
+    """Returns the current time as local text or Unix epoch seconds, formatting it at most once per second."""
+    global _last_timestamp
+    now = int(time.time())
+    if timestamp_format == "epoch":
+        return now
+    cached_second, cached_text = _last_timestamp
+    if now != cached_second:
+        cached_text = time.strftime(TIMESTAMP_FORMAT, time.localtime(now))
+        _last_timestamp = (now, cached_text)
+    return cached_text
+
+
+
+### --- Shared Readers & Checkpoints --- ###
+CHECKPOINT_DIR_NAME = ".evlog"
+
+def _read_event_times(log_file, file_format, start=0, data=None, actions=None):
+    """
+    Parses the event timestamps of a log file, starting at a saved position.
+
+    The position is a byte offset for the line formats (txt, csv, jsonl) and
+    the binary format, and an entry index for JSON (pass the already loaded array as ``data``). Summary
+    rows appended by calculate_total_time are skipped. A trailing line without a
+    newline is still being written and is left for the next call. If an
+    ``actions`` list is given, the action of each parsed event is appended to it.
+
+    Returns:
+        tuple: (list of epoch seconds, position just after the last parsed event)
+    """
+    if file_format == "bin":
+        return _read_bin_event_times(log_file, start, actions)
 
     event_times = []
 
-    with open(log_file, "r") as file:
-        for line in file:
+    if file_format == "json":
+        for entry in data[start:]:
+            if "action" not in entry:
+                continue  # "total_time" summary entry
+            try:
+                event_times.append(timestamp_to_epoch(entry["timestamp"]))
+            except (KeyError, TypeError, ValueError):
+                log.error("Invalid timestamp format in JSON log: %s", entry)
+                continue
+            if actions is not None:
+                actions.append(entry["action"])
+        return event_times, len(data)
+
+    position = start
+    lines = []
+
+    with open(log_file, "rb") as file:
+        file.seek(start)
+        for raw_line in file:
+            if not raw_line.endswith(b"\n"):
+                break
+            position += len(raw_line)
+            lines.append(raw_line.decode("utf-8"))
+
+    if file_format == "txt":
+        for line in lines:
+            if line.startswith("Total time for "):
+                continue
             parts = line.strip().split(": ", 1)  # Extract action & timestamp
             if len(parts) == 2:
-                action, timestamp = parts
                 try:
-                    dt = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
-                    event_times.append(dt)
+                    event_times.append(timestamp_to_epoch(parts[1]))
+                except ValueError:
+                    log.error("Invalid timestamp format in TXT log: %s", line)
+                    continue
+                if actions is not None:
+                    actions.append(parts[0].rsplit(" logged to ", 1)[0])
+    elif file_format == "csv":
+        for row in csv.reader(lines):
+            if len(row) == 3 and row[1] != "Total Time":  # (location, action, timestamp)
+                try:
+                    event_times.append(timestamp_to_epoch(row[2]))
                 except ValueError:
-                    log.error(f"Invalid timestamp format in TXT log: {line}")
+                    log.error("Invalid timestamp format in CSV log: %s", row)
+                    continue
+                if actions is not None:
+                    actions.append(row[1])
+    else:
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                log.error("Invalid JSON line in %s: %s", log_file, line)
+                continue
+            if "action" not in entry:
+                continue
+            try:
+                event_times.append(timestamp_to_epoch(entry["timestamp"]))
+            except (KeyError, TypeError, ValueError):
+                log.error("Invalid timestamp format in JSONL log: %s", entry)
+                continue
+            if actions is not None:
+                actions.append(entry["action"])
+
+    return event_times, position
+
+def _format_entries(file_format, entries):
+    """Formats (location, action, timestamp) tuples as TXT, CSV or JSONL lines."""
+    if file_format == "txt":
+        return [f"{action} logged to {location}: {timestamp}\n" for location, action, timestamp in entries]
+    elif file_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        lines = []
+        for entry in entries:
+            writer.writerow(entry)
+            lines.append(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+        return lines
+    return [
+        json.dumps({"location": location, "action": action, "timestamp": timestamp}) + "\n"
+        for location, action, timestamp in entries
+    ]
+
+def _write_entries(handle, file_format, entries):
+    """Writes (location, action, timestamp) tuples to an open TXT, CSV or JSONL file."""
+    if file_format == "csv":
+        csv.writer(handle).writerows(entries)
+    else:
+        handle.write("".join(_format_entries(file_format, entries)))
 
-    # Ensure we have an even number of events (pairs)
-    if len(event_times) % 2 != 0:
-        log.warning(f"Uneven log entries for {location}, ignoring last entry.")
-        event_times = event_times[:-1]  # Ignore the last unpaired entry
+def _parse_record(file_format, line):
+    """
+    Parses one TXT, CSV or JSONL line into an entry dict shaped like a JSON log
+    entry ("action" for events, "total_time" for summary rows), or None.
+    TXT and CSV summary rows carry no timestamp.
+    """
+    line = line.rstrip("\r\n")
+    if not line:
+        return None
 
-    # Calculate total time
-    total_time = timedelta()
-    for start, end in zip(event_times[0::2], event_times[1::2]):
-        total_time += (end - start)
+    if file_format == "txt":
+        if line.startswith("Total time for "):
+            location, _, total_time = line[len("Total time for "):].partition(": ")
+            return {"location": location, "total_time": total_time, "timestamp": None}
+        head, separator, timestamp = line.partition(": ")
+        action, _, location = head.rpartition(" logged to ")
+        if not separator or not action:
+            return None
+        return {"location": location, "action": action, "timestamp": timestamp}
+
+    if file_format == "csv":
+        row = next(csv.reader([line]), None)
+        if not row or len(row) != 3:
+            return None
+        if row[1] == "Total Time":
+            return {"location": row[0], "total_time": row[2], "timestamp": None}
+        return {"location": row[0], "action": row[1], "timestamp": row[2]}
 
-    total_time_str = str(total_time)
-    log.info(f"Total time logged at {location}: {total_time_str}")
+    try:
+        entry = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+def _iter_lines_reverse(log_file, chunk_size=8192):
+    """Yields the lines of a file from last to first, reading backward from the end in chunks."""
+    with open(log_file, "rb") as file:
+        position = file.seek(0, os.SEEK_END)
+        remainder = b""
+
+        while position > 0:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            file.seek(position)
+            lines = (file.read(read_size) + remainder).split(b"\n")
+            remainder = lines.pop(0)  # May continue in the previous chunk
+            for line in reversed(lines):
+                if line:
+                    yield line.decode("utf-8")
+
+        if remainder:
+            yield remainder.decode("utf-8")
+
+def _iter_json_array(log_file, chunk_size=65536):
+    """
+    Yields the items of a JSON array file one at a time, reading it in chunks
+    so memory stays proportional to a single entry rather than the whole file.
 
-    # Append total time to the TXT log file
-    with open(log_file, "a") as file:
-        file.write(f"Total time for {location}: {total_time_str}\n")
+    Raises:
+        json.JSONDecodeError: If the file is not a JSON array.
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, opened = "", 0, False
 
+    with open(log_file, "r") as file:
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+
+            if pos == len(buffer):
+                chunk = file.read(chunk_size)
+                if not chunk:
+                    raise json.JSONDecodeError("Unterminated array", buffer, pos)
+                buffer, pos = chunk, 0
+                continue
+
+            if not opened:
+                if buffer[pos] != "[":
+                    raise json.JSONDecodeError("Expecting '['", buffer, pos)
+                opened = True
+                pos += 1
+                continue
+
+            if buffer[pos] == "]":
+                return
+
+            try:
+                entry, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # The entry continues in the next chunk
+                chunk = file.read(chunk_size)
+                if not chunk:
+                    raise
+                buffer, pos = buffer[pos:] + chunk, 0
+                continue
+
+            yield entry
+
+def _iter_entries(log_file, file_format):
+    """
+    Lazily yields the events of a log file in any format as
+    (location, action, timestamp) tuples, skipping summary rows.
+    """
+    if file_format == "bin":
+        yield from _iter_bin_entries(log_file)
+    elif file_format == "json":
+        for entry in _iter_json_array(log_file):
+            if "action" in entry:
+                yield entry.get("location"), entry["action"], entry.get("timestamp")
+    elif file_format == "jsonl":
+        for entry in _iter_jsonl(log_file):
+            if "action" in entry:
+                yield entry.get("location"), entry["action"], entry.get("timestamp")
+    elif file_format == "csv":
+        with open(log_file, "r", newline="") as file:
+            for row in csv.reader(file):
+                if len(row) == 3 and row[1] != "Total Time":
+                    yield row[0], row[1], row[2]
+    else:
+        with open(log_file, "r") as file:
+            for line in file:
+                if line.startswith("Total time for "):
+                    continue
+                parts = line.rstrip("\n").split(": ", 1)
+                if len(parts) == 2:
+                    action, _, location = parts[0].rpartition(" logged to ")
+                    if action:
+                        yield location, action, parts[1]
+
+def _checkpoint_path(log_file):
+    log_dir, file_name = os.path.split(log_file)
+    return os.path.join(log_dir, CHECKPOINT_DIR_NAME, file_name + ".ckpt")
+
+# Longest prefix of a line kept in a checkpoint fingerprint
+_MARK_BYTES = 4096
+
+def _checkpoint_marks(log_file, file_format, position, data=None):
+    """
+    Fingerprints the content a checkpoint has consumed: the first line (record,
+    JSON entry) of the file and the one ending at ``position``. A file that was
+    deleted and recreated, or rewritten in place, no longer matches even if it
+    got the same inode back.
+    """
+    if position <= 0:
+        return {"head": None, "tail": None}
+    if file_format == "json":
+        return {"head": data[0], "tail": data[position - 1]}
+
+    with open(log_file, "rb") as file:
+        if file_format == "bin":
+            head = file.read(binstore.RECORD_SIZE)
+            file.seek(position - binstore.RECORD_SIZE)
+            tail = file.read(binstore.RECORD_SIZE)
+        else:
+            head = file.readline(min(position, _MARK_BYTES))
+            start = max(0, position - _MARK_BYTES)
+            file.seek(start)
+            chunk = file.read(position - start)
+            tail = chunk[chunk.rfind(b"\n", 0, len(chunk) - 1) + 1:]
+    return {"head": head.hex(), "tail": tail.hex()}
+
+def _load_checkpoint(log_file, file_format, current_size, data=None):
+    """Returns the saved checkpoint for a log file, or a fresh one if it is missing or stale."""
+    checkpoint = {"position": 0, "total_seconds": 0, "open_event": None}
+    checkpoint_file = _checkpoint_path(log_file)
+
+    try:
+        with open(checkpoint_file, "r") as file:
+            saved = json.load(file)
+    except (OSError, ValueError):
+        return checkpoint
+
+    # A file that shrank, was replaced or was rewritten no longer starts with what was counted: start over
+    if file_format != "json" and saved.get("inode") != os.stat(log_file).st_ino:
+        return checkpoint
+    if saved.get("position", 0) > current_size:
+        return checkpoint
+    if saved.get("marks") != _checkpoint_marks(log_file, file_format, saved.get("position", 0), data):
+        return checkpoint
+
+    checkpoint.update(saved)
+    return checkpoint
+
+def _save_checkpoint(log_file, file_format, checkpoint, data=None):
+    checkpoint_file = _checkpoint_path(log_file)
+    os.makedirs(os.path.dirname(checkpoint_file), exist_ok=True)
+
+    if file_format != "json":
+        checkpoint["inode"] = os.stat(log_file).st_ino
+    checkpoint["marks"] = _checkpoint_marks(log_file, file_format, checkpoint["position"], data)
+
+    temp_file = _temp_path(checkpoint_file)
+    with open(temp_file, "w") as file:
+        json.dump(checkpoint, file)
+        binstore.sync_file(file)
+    os.replace(temp_file, checkpoint_file)
+    binstore.sync_directory(checkpoint_file)
+
+def _remove_sidecars(log_file):
+    """Removes the checkpoint, index, lock, cache entry and (for binary logs) name dictionary of a deleted log file."""
+    _event_cache.invalidate(log_file)
+    _discard_unsaved_index(log_file)
+    sidecars = [_checkpoint_path(log_file), _index_path(log_file), _lock_path(log_file)]
+    if log_file.endswith(".bin") and not os.path.exists(log_file):
+        sidecars.append(binstore.names_path(log_file))
+        _name_dictionaries.pop(log_file, None)
+
+    for sidecar in sidecars:
+        try:
+            os.remove(sidecar)
+        except OSError:
+            pass
+
+def _calculate_log_total(location, log_file, file_format, incremental=False, data=None):
+    """
+    Pairs the events of a log file into total time.
+
+    In incremental mode only events appended since the last call are parsed; the
+    running total and any unpaired "Arrival" are carried over in a checkpoint
+    stored under ``<log_dir>/.evlog/``.
+    """
+    if not incremental:
+        return calculate_time(_event_times(log_file, file_format), location, log_file)
+
+    current_size = len(data) if file_format == "json" else os.path.getsize(log_file)
+    checkpoint = _load_checkpoint(log_file, file_format, current_size, data)
+
+    event_times, position = _read_event_times(log_file, file_format, checkpoint["position"], data)
+    if metrics.enabled:
+        metrics.inc("evlog_events_parsed_total", len(event_times), format=file_format)
+        if file_format != "json":
+            metrics.inc("evlog_bytes_read_total", position - checkpoint["position"], format=file_format)
+
+    open_event = checkpoint["open_event"]
+    if open_event is not None:
+        event_times.insert(0, open_event if isinstance(open_event, int) else timestamp_to_epoch(open_event))
+
+    if len(event_times) % 2 != 0:
+        open_event = event_times.pop()
+    else:
+        open_event = None
+
+    total_seconds = checkpoint["total_seconds"] + paired_total(event_times)
+    total_time = timedelta(seconds=total_seconds)
+
+    checkpoint.update(position=position, total_seconds=total_seconds, open_event=open_event)
+    _save_checkpoint(log_file, file_format, checkpoint, data)
+
+    log.info("Total time logged at %s: %s", location, total_time)
     return total_time
 
 
 
-### --- CSV Log Functions --- ###
-def log_event_csv(location: str, action: str, log_dir=DEFAULT_LOG_DIR):
-    """Logs an event in a CSV file."""
-    os.makedirs(log_dir, exist_ok=True)
-    log_file = os.path.join(log_dir, f"{location}_Tracking.csv")
+### --- Parsed Event Cache --- ###
+_event_cache = EventCache()
+
+def configure_cache(max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Sets the memory budget of the parsed-event cache shared by the reader
+    functions (calculate_total_time, calculate_group_totals, extract_event,
+    merge_logs, query_events, generate_summary_report). 0 disables it.
+    """
+    _event_cache.resize(max_bytes)
 
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+def cache_stats():
+    """Returns the cache's hits, misses, hit_rate, extends, evictions, invalidations, files, bytes and max_bytes."""
+    return _event_cache.stats()
 
+def clear_cache():
+    """Drops every cached file."""
+    _event_cache.clear()
+
+def _parse_into(parsed, log_file, file_format, data=None):
+    """
+    Parses a TXT, CSV or JSONL log from ``parsed.position`` (or a whole JSON log,
+    from ``data`` if already loaded) into ``parsed``. Rows whose timestamp cannot
+    be parsed are skipped, like _read_event_times does.
+
+    Raises:
+        json.JSONDecodeError: If a JSON log is not a valid array.
+    """
+    start = parsed.position
+
+    if file_format == "json":
+        if data is None:
+            with open(log_file, "r") as file:
+                data = json.load(file)
+        rows = _entry_rows(parsed, data)
+    else:
+        lines = []
+        with open(log_file, "rb") as file:
+            file.seek(parsed.position)
+            for raw_line in file:
+                if not raw_line.endswith(b"\n"):
+                    break  # Still being written
+                if parsed.position == 0:
+                    parsed.head = raw_line
+                parsed.position += len(raw_line)
+                parsed.tail = raw_line
+                lines.append(raw_line.decode("utf-8"))
+
+        if file_format == "txt":
+            rows = _txt_rows(parsed, lines)
+        elif file_format == "csv":
+            rows = _csv_rows(parsed, lines)
+        else:
+            rows = _entry_rows(parsed, (_parse_record("jsonl", line) for line in lines))
+
+    names = {}  # Share one string object per distinct location and action
+    for location, action, timestamp in rows:
+        try:
+            epoch = timestamp_to_epoch(timestamp)
+        except (AttributeError, TypeError, ValueError):
+            log.error("Invalid timestamp format in %s: %r (%s, %s)", log_file, timestamp, location, action)
+            continue
+        parsed.append(epoch, names.setdefault(location, location), names.setdefault(action, action), timestamp)
+
+    if metrics.enabled:
+        metrics.inc("evlog_events_parsed_total", len(parsed.epochs) - parsed.count, format=file_format)
+        metrics.inc("evlog_bytes_read_total", os.path.getsize(log_file) if file_format == "json" else parsed.position - start,
+                    format=file_format)
+
+    parsed.count = len(parsed.epochs)
+    return parsed
+
+def _txt_rows(parsed, lines):
+    for line in lines:
+        if line.startswith("Total time for "):
+            parsed.summary = _parse_record("txt", line)
+            continue
+        head, separator, timestamp = line.rstrip("\r\n").partition(": ")
+        action, _, location = head.rpartition(" logged to ")
+        if separator and action:
+            yield location, action, timestamp
+
+def _csv_rows(parsed, lines):
+    for row in csv.reader(lines):
+        if len(row) != 3:
+            continue
+        if row[1] == "Total Time":
+            parsed.summary = {"location": row[0], "total_time": row[2], "timestamp": None}
+            continue
+        yield row
+
+def _entry_rows(parsed, entries):
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        if "action" in entry:
+            yield entry.get("location"), entry["action"], entry.get("timestamp")
+        elif "total_time" in entry:
+            parsed.summary = entry
+
+def _cached_log(log_file, file_format, data=None):
+    """
+    Returns the parsed events of a TXT, CSV, JSON or JSONL log from the cache,
+    parsing only what is missing: nothing if the file is unchanged, the new
+    lines if it was only appended to, or the whole file otherwise.
+
+    Raises:
+        json.JSONDecodeError: If a JSON log is not a valid array.
+    """
+    key = stat_key(os.stat(log_file))
+    parsed = _event_cache.get(log_file, key)
+    if parsed is not None:
+        return parsed
+
+    cached = _event_cache.peek(log_file)
+    if cached is not None and file_format != "json":
+        cached_key, cached_parsed = cached
+        if (cached_key[0] == key[0] and cached_key[1] < key[1] and cached_parsed.position <= key[1]
+                and _prefix_unchanged(log_file, cached_parsed)):
+            # Same file, appended to by another writer: parse only the tail
+            tail = ParsedLog()
+            tail.position = cached_parsed.position
+            _parse_into(tail, log_file, file_format)
+            _event_cache.extend(
+                log_file, cached_key, key,
+                zip(tail.epochs, tail.locations, tail.actions, tail.timestamps), tail.summary, tail.position,
+            )
+            if log_file in _event_cache:
+                return cached_parsed
+
+    parsed = _parse_into(ParsedLog(), log_file, file_format, data)
+    _event_cache.put(log_file, key, parsed)
+    return parsed
+
+def _prefix_unchanged(log_file, parsed):
+    """
+    Checks that a file still starts with the lines a cached entry was parsed
+    from, by re-reading its first and last parsed line (an in-place rewrite
+    keeps the inode and may grow the file).
+    """
+    if parsed.position and parsed.tail is None:
+        return False  # Extended by a write that did not record its last line
+
+    with open(log_file, "rb") as file:
+        for offset, expected in ((0, parsed.head), (parsed.position - len(parsed.tail or b""), parsed.tail)):
+            if expected is None:
+                continue
+            file.seek(offset)
+            if file.read(len(expected)) != expected:
+                return False
+    return True
+
+def _event_times(log_file, file_format, actions=None):
+    """Returns every event epoch of a log file (served from the cache except for binary logs)."""
+    if file_format == "bin":
+        event_times, position = _read_bin_event_times(log_file, 0, actions)
+        if metrics.enabled:
+            metrics.inc("evlog_events_parsed_total", len(event_times), format="bin")
+            metrics.inc("evlog_bytes_read_total", position, format="bin")
+        return event_times
+
+    parsed = _cached_log(log_file, file_format)
+    count = parsed.count
+    if actions is not None:
+        actions.extend(parsed.actions[:count])
+    return parsed.epochs[:count] if len(parsed.epochs) != count else parsed.epochs
+
+def _stat_key_or_none(log_file):
+    if log_file not in _event_cache:
+        return None
     try:
-        with open(log_file, "a", newline="") as file:
-            writer = csv.writer(file)
-            writer.writerow([location, action, current_time])
-    except Exception as e:
-        log.error(f"Error writing to CSV log: {e}")
+        return stat_key(os.stat(log_file))
+    except FileNotFoundError:
+        return None
 
-def calculate_total_time_csv(location: str, log_dir=DEFAULT_LOG_DIR):
-    """Calculates total time from CSV log format and appends it to the same CSV file."""
-    log_file = os.path.join(log_dir, f"{location}_Tracking.csv")
+def _cache_appended(log_file, previous_key, entries=(), summary=None, stat=None, tail=None):
+    """
+    Extends the cached events of a file after a writer appended ``entries`` or a
+    summary row. ``previous_key`` is the file's key from before the write (None
+    when the file is not cached); ``stat`` is its state after the write if known,
+    and ``tail`` the last line written (as bytes).
+    """
+    if previous_key is None:
+        return
+    try:
+        rows = [(timestamp_to_epoch(timestamp), location, action, timestamp) for location, action, timestamp in entries]
+        key = stat_key(stat or os.stat(log_file))
+    except (OSError, TypeError, ValueError):
+        _event_cache.invalidate(log_file)
+        return
+    _event_cache.extend(log_file, previous_key, key, rows, summary, tail=tail)
+
+
+
+### --- File Locking --- ###
+_file_locking = False
+_lock_counters = {"acquired": 0, "contended": 0, "wait_seconds": 0.0}
+_lock_counters_lock = threading.Lock()
+
+def enable_file_locking():
+    """
+    Makes writes safe across processes: every append, summary row and JSON
+    rewrite holds an exclusive ``fcntl`` lock on the log file while it runs.
+
+    Applies to EventLogger instances created with ``locking=None`` (including the
+    one behind log_event). Locks are advisory, so every writing process must enable them.
+    """
+    global _file_locking
+    _file_locking = True
+
+def disable_file_locking():
+    """Turns off cross-process file locking (the default)."""
+    global _file_locking
+    _file_locking = False
+
+def lock_stats(reset=False):
+    """
+    Returns lock counters for this process: locks "acquired", how many were
+    "contended" (another writer held the lock) and the total "wait_seconds".
+    """
+    with _lock_counters_lock:
+        stats = dict(_lock_counters)
+        if reset:
+            _lock_counters.update(acquired=0, contended=0, wait_seconds=0.0)
+    return stats
+
+def _lock_path(log_file):
+    log_dir, file_name = os.path.split(log_file)
+    return os.path.join(log_dir, CHECKPOINT_DIR_NAME, file_name + ".lock")
+
+def _temp_path(path):
+    """A temporary file name next to ``path`` that concurrent writers will not share."""
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+@contextlib.contextmanager
+def _file_lock(log_file, enabled=True):
+    """
+    Holds an exclusive advisory lock for a log file while the block runs.
+
+    The lock is taken on a sidecar under ``<log_dir>/.evlog/`` rather than on the
+    log itself, which JSON rewrites replace with a new file.
+    """
+    if not enabled or fcntl is None:
+        yield
+        return
+
+    lock_file = _lock_path(log_file)
+    try:
+        fd = os.open(lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(lock_file), exist_ok=True)
+        fd = os.open(lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+
+    try:
+        waited = 0.0
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            contended = 0
+        except BlockingIOError:
+            started = time.perf_counter()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            waited = time.perf_counter() - started
+            contended = 1
+
+        with _lock_counters_lock:
+            _lock_counters["acquired"] += 1
+            _lock_counters["contended"] += contended
+            _lock_counters["wait_seconds"] += waited
+
+        yield
+    finally:
+        os.close(fd)  # Closing the descriptor releases the lock
+
+def _load_json_for_write(log_file):
+    """
+    Loads a JSON log that is about to be rewritten.
+
+    A file that does not parse is moved aside to ``<file>.corrupt-<time>`` so
+    its contents are kept, and writing continues with a new array.
+    """
+    try:
+        with open(log_file, "r") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return []
+    except json.JSONDecodeError:
+        corrupt_file = f"{log_file}.corrupt-{time.strftime('%Y%m%d%H%M%S')}"
+        os.replace(log_file, corrupt_file)
+        log.error("Corrupt JSON file detected at %s, moved to %s", log_file, corrupt_file)
+        return []
+
+def _replace_json(log_file, data):
+    """Writes a JSON log to a temporary file and renames it over the original, so readers never see a partial file."""
+    temp_file = _temp_path(log_file)
+    with open(temp_file, "w") as file:
+        json.dump(data, file, indent=4)
+        binstore.sync_file(file)
+    os.replace(temp_file, log_file)
+    binstore.sync_directory(log_file)
+
+
+
+### --- Event Index --- ###
+# Indexes updated by writers are kept in memory and saved in the background, so
+# appends do not rewrite the sidecar on every event
+INDEX_SAVE_INTERVAL = 1.0
+
+_unsaved_indexes = {}  # log_file -> index updated since it was last saved
+_unsaved_indexes_lock = threading.Lock()
+_index_timer = None
+
+def _index_path(log_file):
+    log_dir, file_name = os.path.split(log_file)
+    return os.path.join(log_dir, CHECKPOINT_DIR_NAME, file_name + ".idx")
+
+def _new_index():
+    return {"size": 0, "inode": None, "latest": {}, "actions": {}}
+
+def _load_index(log_file):
+    _save_unsaved_indexes([log_file])
+    try:
+        with open(_index_path(log_file), "r") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+def _stamp_index(log_file, index, stat=None):
+    """Records the size and inode of the file an index describes."""
+    stat = stat or os.stat(log_file)
+    index["size"] = stat.st_size
+    index["inode"] = stat.st_ino
+
+def _save_index(log_file, index):
+    index_file = _index_path(log_file)
+    os.makedirs(os.path.dirname(index_file), exist_ok=True)
+    temp_file = _temp_path(index_file)
+    with open(temp_file, "w") as file:
+        file.write(index if isinstance(index, str) else json.dumps(index))
+        binstore.sync_file(file)
+    os.replace(temp_file, index_file)
+    binstore.sync_directory(index_file)
+
+def _queue_index(log_file, index):
+    """
+    Queues an index for the next background save (at most INDEX_SAVE_INTERVAL
+    seconds away). Call with ``_unsaved_indexes_lock`` held.
+    """
+    global _index_timer
+    _unsaved_indexes[log_file] = index
+    if _index_timer is None:
+        _index_timer = threading.Timer(INDEX_SAVE_INTERVAL, _save_unsaved_indexes)
+        _index_timer.daemon = True
+        _index_timer.start()
+
+@atexit.register
+def _save_unsaved_indexes(log_files=None):
+    """Saves the queued indexes of ``log_files`` (default: all of them)."""
+    global _index_timer
+    with _unsaved_indexes_lock:
+        if log_files is None:
+            _index_timer = None
+            log_files = list(_unsaved_indexes)
+        # Serialized under the lock: writers update the same dicts in place
+        pending = [(log_file, json.dumps(_unsaved_indexes.pop(log_file)))
+                   for log_file in log_files if log_file in _unsaved_indexes]
+
+    for log_file, text in pending:
+        if not os.path.exists(log_file):
+            continue  # Deleted (with its directory) before the index was saved
+        try:
+            _save_index(log_file, text)
+        except OSError as e:
+            log.error("Error saving index for %s: %s", log_file, e)
+
+def _discard_unsaved_index(log_file):
+    with _unsaved_indexes_lock:
+        _unsaved_indexes.pop(log_file, None)
+
+def _index_is_current(index, log_file):
+    """An index is only trusted if nothing was written to the file behind its back."""
+    if index is None:
+        return False
+    try:
+        stat = os.stat(log_file)
+    except OSError:
+        return False
+    return index.get("size") == stat.st_size and index.get("inode") == stat.st_ino
+
+def _index_records(index, records):
+    """Records the latest entry per event type and per action from (offset, entry) pairs."""
+    latest, actions = index["latest"], index["actions"]
+    for offset, entry in records:
+        if "action" in entry:
+            item = {"offset": offset, "entry": entry}
+            latest["action"] = item
+            actions[entry["action"]] = item
+        elif "total_time" in entry:
+            latest["total_time"] = {"offset": offset, "entry": entry}
+
+def _update_index(log_file, previous_size, records, index=None, stat=None):
+    """
+    Extends the index of an append-only log after ``records`` were written at
+    ``previous_size`` and queues it to be saved. If the index does not describe
+    the file as it was before the write (e.g. another process appended to it),
+    it is left stale so extract_event falls back to scanning.
+
+    Parameters:
+        stat (os.stat_result, optional): The file's stat after the write.
+
+    Returns:
+        dict or None: The updated index, for callers that keep it in memory.
+    """
+    if previous_size == 0:
+        index = _new_index()
+    elif index is None or index.get("size") != previous_size:
+        # The in-memory copy may predate a summary row appended by another writer
+        index = _load_index(log_file)
+        if index is None or index.get("size") != previous_size:
+            return None
+
+    with _unsaved_indexes_lock:
+        _index_records(index, records)
+        _stamp_index(log_file, index, stat)
+        _queue_index(log_file, index)
+    return index
+
+def _append_summary_row(log_file, file_format, line, entry):
+    """Appends a "Total Time" row to a line-based log, keeping its index current."""
+    previous_size = os.path.getsize(log_file)
+
+    with open(log_file, "a", newline="" if file_format == "csv" else None) as file:
+        file.write(line)
+
+    _update_index(log_file, previous_size, [(previous_size, entry)])
+
+def _append_total_time(log_file, file_format, location, total_time, data=None):
+    """
+    Appends a "Total Time" summary row in the file's format and keeps its index
+    current. For JSON, ``data`` is the already loaded array (read if omitted).
+    """
+    with _file_lock(log_file, _file_locking):
+        if _file_locking:
+            data = None  # Another process may have rewritten the file since it was read
+        rewritten = _write_total_time(log_file, file_format, location, total_time, data)
+
+    if rewritten is not None:
+        _rebuild_json_index(log_file, *rewritten)
+
+def _write_total_time(log_file, file_format, location, total_time, data):
+    """
+    Writes a summary row; call with the file lock held.
+
+    Returns:
+        tuple or None: For JSON, the (array, os.stat() result) the index is rebuilt from.
+    """
+    previous_key = _stat_key_or_none(log_file)
+
+    if file_format in ("txt", "csv"):
+        summary_entry = {"location": location, "total_time": str(total_time), "timestamp": None}
+        if file_format == "txt":
+            line = f"Total time for {location}: {total_time}\n"
+        else:
+            line = _format_entries("csv", [(location, "Total Time", str(total_time))])[0]
+        _append_summary_row(log_file, file_format, line, summary_entry)
+        _cache_appended(log_file, previous_key, summary=summary_entry, tail=line.encode("utf-8"))
+    elif file_format == "bin":
+        names = _bin_names(log_file)
+        record = (timestamp_to_epoch(_current_timestamp()), int(total_time.total_seconds()), binstore.SUMMARY_ACTION_ID,
+                  names.intern(location))
+
+        previous_size = os.path.getsize(log_file)
+        with open(log_file, "ab") as file:
+            file.write(binstore.pack_records([record]))
+
+        _update_index(log_file, previous_size, [(previous_size, _bin_entry(names, *record))])
+    else:
+        summary_entry = {
+            "location": location,
+            "total_time": str(total_time),
+            "timestamp": _current_timestamp()
+        }
+
+        if file_format == "jsonl":
+            line = json.dumps(summary_entry) + "\n"
+            _append_summary_row(log_file, "jsonl", line, summary_entry)
+            _cache_appended(log_file, previous_key, summary=summary_entry, tail=line.encode("utf-8"))
+            return
+
+        if data is None:
+            data = _load_json_for_write(log_file)
+        data.append(summary_entry)
+
+        # Write updated log back to JSON file
+        _replace_json(log_file, data)
+        _cache_appended(log_file, previous_key, summary=summary_entry)
+
+        return data, os.stat(log_file)
+
+def _rebuild_json_index(log_file, data, stat=None):
+    """
+    Indexes a JSON log from its loaded array (offsets are entry positions) and
+    queues it to be saved. ``stat`` is the file's state when ``data`` was written.
+    """
+    index = _new_index()
+    _index_records(index, enumerate(data))
+    _stamp_index(log_file, index, stat)
+    with _unsaved_indexes_lock:
+        _queue_index(log_file, index)
+    return index
+
+@metrics.instrumented()
+def rebuild_index(location: str, file_format="json", log_dir=None):
+    """
+    Builds the sidecar index used by extract_event for an existing log file.
+
+    Logs written by evlog keep their index current automatically; this is only
+    needed for files written before indexing existed or by other tools.
+
+    Returns:
+        bool: True if the index was written.
+    """
+    log_dir = _log_dir(log_dir)
+    log_file = os.path.join(log_dir, f"{location}_Tracking.{file_format}")
+
+    if not os.path.exists(log_file):
+        log.warning("%s log file not found: %s", file_format.upper(), log_file)
+        return False
+
+    if file_format == "json":
+        try:
+            with open(log_file, "r") as file:
+                _rebuild_json_index(log_file, json.load(file))
+        except json.JSONDecodeError:
+            log.error("Error decoding JSON in %s", log_file)
+            return False
+        _save_unsaved_indexes([log_file])
+        return True
+
+    index = _new_index()
+
+    if file_format == "bin":
+        records = reversed(list(_iter_bin_records_reverse(log_file)))
+    else:
+        offset = 0
+        records = []
+        with open(log_file, "rb") as file:
+            for raw_line in file:
+                entry = _parse_record(file_format, raw_line.decode("utf-8"))
+                if entry is not None:
+                    records.append((offset, entry))
+                offset += len(raw_line)
+
+    _index_records(index, records)
+    _stamp_index(log_file, index)
+    _discard_unsaved_index(log_file)
+    _save_index(log_file, index)
+    return True
+
+
+
+### --- TXT Log Functions --- ###
+def log_event_txt(location: str, action: str, log_dir=None):
+    """Logs an event in a TXT file."""
+    log_dir = _log_dir(log_dir)
+    _get_default_logger().log(location, action, "txt", log_dir)
+
+def calculate_total_time_txt(location: str, log_dir=None, incremental=False, write_summary=True):
+    """Calculates total time from TXT log format and appends it to the same TXT file."""
+    log_dir = _log_dir(log_dir)
+    log_file = os.path.join(log_dir, f"{location}_Tracking.txt")
 
     if not os.path.exists(log_file):
-        log.warning(f"CSV log file not found: {log_file}")
+        log.warning("TXT log file not found: %s", log_file)
         return None
 
-    event_times = []
+    total_time = _calculate_log_total(location, log_file, "txt", incremental)
 
-    with open(log_file, "r") as file:
-        reader = csv.reader(file)
-        for row in reader:
-            if len(row) == 3:  # Ensure row contains (location, action, timestamp)
-                try:
-                    dt = datetime.strptime(row[2], "%Y-%m-%d %H:%M:%S")
-                    event_times.append(dt)
-                except ValueError:
-                    log.error(f"Invalid timestamp format in CSV log: {row}")
+    if not write_summary:
+        return total_time
 
-    # Ensure we have an even number of events (pairs)
-    if len(event_times) % 2 != 0:
-        log.warning(f"Uneven log entries for {location}, ignoring last entry.")
-        event_times = event_times[:-1]  # Ignore the last unpaired entry
+    # Append total time to the TXT log file
+    _append_total_time(log_file, "txt", location, total_time)
+
+    return total_time
 
-    # Calculate total time
-    total_time = timedelta()
-    for start, end in zip(event_times[0::2], event_times[1::2]):
-        total_time += (end - start)
 
-    total_time_str = str(total_time)
-    log.info(f"Total time logged at {location}: {total_time_str}")
+
+### --- CSV Log Functions --- ###
+def log_event_csv(location: str, action: str, log_dir=None):
+    """Logs an event in a CSV file."""
+    log_dir = _log_dir(log_dir)
+    _get_default_logger().log(location, action, "csv", log_dir)
+
+def calculate_total_time_csv(location: str, log_dir=None, incremental=False, write_summary=True):
+    """Calculates total time from CSV log format and appends it to the same CSV file."""
+    log_dir = _log_dir(log_dir)
+    log_file = os.path.join(log_dir, f"{location}_Tracking.csv")
+
+    if not os.path.exists(log_file):
+        log.warning("CSV log file not found: %s", log_file)
+        return None
+
+    total_time = _calculate_log_total(location, log_file, "csv", incremental)
+
+    if not write_summary:
+        return total_time
 
     # Append total time to the CSV log file
-    with open(log_file, "a", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerow([location, "Total Time", total_time_str])
+    _append_total_time(log_file, "csv", location, total_time)
 
     return total_time
 
 
 
 ### --- JSON Log Functions --- ###
-def log_event_json(location: str, action: str, log_dir=DEFAULT_LOG_DIR):
+def log_event_json(location: str, action: str, log_dir=None):
     """Logs an event in a JSON file."""
-    os.makedirs(log_dir, exist_ok=True)
+    log_dir = _log_dir(log_dir)
+    _get_default_logger().log(location, action, "json", log_dir)
+
+def calculate_total_time_json(location: str, log_dir=None, incremental=False, write_summary=True):
+    """Calculates total time from JSON log format and appends it to the same JSON file."""
+    log_dir = _log_dir(log_dir)
     log_file = os.path.join(log_dir, f"{location}_Tracking.json")
 
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_entry = {"location": location, "action": action, "timestamp": current_time}
+    if not os.path.exists(log_file):
+        log.warning("JSON log file not found: %s", log_file)
+        return None
 
+    data = None
     try:
-        if os.path.exists(log_file):
+        if incremental:
+            # Read JSON log file (full totals are served from the parsed-event cache)
             with open(log_file, "r") as file:
                 data = json.load(file)
-        else:
-            data = []
+        total_time = _calculate_log_total(location, log_file, "json", incremental, data)
     except json.JSONDecodeError:
-        log.error(f"Corrupt JSON file detected at {log_file}, resetting...")
-        data = []
+        log.error("Invalid JSON format in %s", log_file)
+        return None
 
-    data.append(log_entry)
+    if not write_summary:
+        return total_time
 
-    with open(log_file, "w") as file:
-        json.dump(data, file, indent=4)
+    # Append total time to the JSON log file
+    _append_total_time(log_file, "json", location, total_time, data)
 
-def calculate_total_time_json(location: str, log_dir=DEFAULT_LOG_DIR):
-    """Calculates total time from JSON log format and appends it to the same JSON file."""
-    log_file = os.path.join(log_dir, f"{location}_Tracking.json")
+    return total_time
+
+
+
+### --- JSONL Log Functions --- ###
+def log_event_jsonl(location: str, action: str, log_dir=None):
+    """Logs an event as a single line in a JSON Lines file (append-only)."""
+    log_dir = _log_dir(log_dir)
+    _get_default_logger().log(location, action, "jsonl", log_dir)
+
+def _iter_jsonl(log_file):
+    """Yields the entries of a JSON Lines file one at a time, skipping corrupt lines."""
+    with open(log_file, "r") as file:
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                log.error("Invalid JSON line in %s: %s", log_file, line)
+
+def calculate_total_time_jsonl(location: str, log_dir=None, incremental=False, write_summary=True):
+    """Calculates total time from JSONL log format and appends it to the same JSONL file."""
+    log_dir = _log_dir(log_dir)
+    log_file = os.path.join(log_dir, f"{location}_Tracking.jsonl")
 
     if not os.path.exists(log_file):
-        log.warning(f"JSON log file not found: {log_file}")
+        log.warning("JSONL log file not found: %s", log_file)
         return None
 
-    event_times = []
+    total_time = _calculate_log_total(location, log_file, "jsonl", incremental)
+
+    if not write_summary:
+        return total_time
+
+    # Append total time to the JSONL log file
+    _append_total_time(log_file, "jsonl", location, total_time)
+
+    return total_time
+
+@metrics.instrumented()
+def migrate_json_to_jsonl(log_dir=None, locations: list = None, remove_source=False):
+    """
+    Converts existing JSON-array log files to the append-only JSON Lines format.
+
+    Entries already present in a ``<location>_Tracking.jsonl`` file are kept and
+    placed after the migrated history. The new file is written to a temporary
+    path and moved into place, so an interrupted migration never leaves a
+    half-written log behind. A location whose JSONL file already begins with the
+    JSON history is skipped, so running the migration again is harmless.
+
+    Parameters:
+        log_dir (str): Directory where log files are stored.
+        locations (list, optional): Locations to migrate (default: every JSON log in log_dir).
+        remove_source (bool): Delete the original JSON file (and its sidecars) after a successful
+            or earlier migration.
+
+    Returns:
+        list: Paths of the JSONL files that were written.
+    """
+    log_dir = _log_dir(log_dir)
+    if locations is None:
+        locations = [
+            file_name[:-len("_Tracking.json")]
+            for file_name in sorted(os.listdir(log_dir))
+            if file_name.endswith("_Tracking.json")
+        ]
+
+    migrated = []
+
+    for location in locations:
+        source_file = os.path.join(log_dir, f"{location}_Tracking.json")
+        target_file = os.path.join(log_dir, f"{location}_Tracking.jsonl")
+
+        if not os.path.exists(source_file):
+            log.warning("JSON log file not found: %s", source_file)
+            continue
+
+        # Flush events still buffered for the source so they are migrated too
+        _release_file(source_file)
+        try:
+            with open(source_file, "r") as file:
+                data = json.load(file)
+        except json.JSONDecodeError:
+            log.error("Invalid JSON format in %s, skipping migration", source_file)
+            continue
+
+        # Flush events still buffered for the target before its contents are copied
+        _release_file(target_file)
+
+        with _file_lock(target_file, _file_locking):
+            if _starts_with_entries(target_file, data):
+                log.info("%s already holds the entries of %s, skipping migration", target_file, source_file)
+            else:
+                _migrate_into(target_file, data)
+                migrated.append(target_file)
+                log.info("Migrated %s entries from %s to %s", len(data), source_file, target_file)
+
+        if remove_source:
+            os.remove(source_file)
+            _remove_sidecars(source_file)
+
+    return migrated
+
+def _starts_with_entries(log_file, entries):
+    """Checks whether a JSON Lines file begins with ``entries`` (i.e. a migration already ran)."""
+    if not os.path.exists(log_file):
+        return False
+
+    with open(log_file, "r") as file:
+        lines = iter(file)
+        for entry in entries:
+            line = next(lines, None)
+            if line is None:
+                return False
+            try:
+                if json.loads(line) != entry:
+                    return False
+            except json.JSONDecodeError:
+                return False
+    return True
+
+def _migrate_into(target_file, data):
+    """Rewrites a JSONL file as the migrated ``data`` followed by its current lines."""
+    temp_file = _temp_path(target_file)
+    with open(temp_file, "w") as out:
+        for entry in data:
+            out.write(json.dumps(entry) + "\n")
+
+        # Keep anything already logged in the new format
+        if os.path.exists(target_file):
+            with open(target_file, "r") as existing:
+                for line in existing:
+                    out.write(line)
+        binstore.sync_file(out)
+
+    os.replace(temp_file, target_file)
+    binstore.sync_directory(target_file)
+    _event_cache.invalidate(target_file)
+
+
+
+### --- Binary Log Functions --- ###
+_name_dictionaries = {}
+
+def _bin_names(log_file):
+    """Returns the cached name dictionary of a binary log."""
+    names = _name_dictionaries.get(log_file)
+    if names is None:
+        names = _name_dictionaries[log_file] = binstore.NameDictionary(binstore.names_path(log_file))
+    return names
+
+def _bin_entry(names, epoch, value, action_id, location_id):
+    """Converts a binary record into an entry dict shaped like a JSON log entry."""
+    entry = {"location": names.name(location_id)}
+    if action_id == binstore.SUMMARY_ACTION_ID:
+        entry["total_time"] = str(timedelta(seconds=value))
+    else:
+        entry["action"] = names.name(action_id)
+    entry["timestamp"] = format_timestamp(epoch)
+    return entry
+
+def _read_bin_event_times(log_file, start=0, actions=None):
+    """
+    Reads the event epochs of a binary log straight from its mapped columns
+    into an ``array("q")``, skipping summary records by position.
+    """
+    with binstore.RecordView(log_file, start) as view:
+        summaries = view.summary_positions()
+        event_times = view.column("epochs", summaries)
+        if actions is not None:
+            actions.extend(map(_bin_names(log_file).name, view.column("action_ids", summaries)))
+        position = view.end
+
+    return event_times, position
+
+def _iter_bin_entries(log_file):
+    """Yields the events of a binary log as (location, action, timestamp) tuples."""
+    names = _bin_names(log_file)
+    with binstore.RecordView(log_file) as view:
+        for epoch, action_id, location_id in zip(view.epochs, view.action_ids, view.location_ids):
+            if action_id != binstore.SUMMARY_ACTION_ID:
+                yield names.name(location_id), names.name(action_id), format_timestamp(epoch)
+
+def _iter_bin_records_reverse(log_file):
+    """Yields (offset, entry) pairs of a binary log from the last record to the first."""
+    names = _bin_names(log_file)
+    for offset, epoch, value, action_id, location_id in binstore.iter_records_reverse(log_file):
+        yield offset, _bin_entry(names, epoch, value, action_id, location_id)
+
+def _bin_records(log_file, entries):
+    """Interns names and packs (location, action, timestamp) tuples as binary records."""
+    names = _bin_names(log_file)
+    return [
+        (timestamp_to_epoch(timestamp), 0, names.intern(action), names.intern(location))
+        for location, action, timestamp in entries
+    ]
+
+def log_event_bin(location: str, action: str, log_dir=None):
+    """Logs an event as a fixed-width record in a binary log file."""
+    log_dir = _log_dir(log_dir)
+    _get_default_logger().log(location, action, "bin", log_dir)
+
+def calculate_total_time_bin(location: str, log_dir=None, incremental=False, write_summary=True):
+    """Calculates total time from the binary log format and appends it as a summary record."""
+    log_dir = _log_dir(log_dir)
+    log_file = os.path.join(log_dir, f"{location}_Tracking.bin")
+
+    if not os.path.exists(log_file):
+        log.warning("BIN log file not found: %s", log_file)
+        return None
+
+    total_time = _calculate_log_total(location, log_file, "bin", incremental)
+
+    if not write_summary:
+        return total_time
+
+    # Append total time as a summary record
+    _append_total_time(log_file, "bin", location, total_time)
+
+    return total_time
+
+def _write_entry_stream(handle, file_format, entries):
+    """Writes (location, action, timestamp) events to an open TXT, CSV or JSONL file in batches."""
+    batch = []
+    for entry in entries:
+        batch.append(entry)
+        if len(batch) >= 1000:
+            _write_entries(handle, file_format, batch)
+            batch = []
+    _write_entries(handle, file_format, batch)
+
+def _write_log_file(log_file, file_format, entries):
+    """Writes (location, action, timestamp) events to a new log file, replacing it once complete."""
+    _release_file(log_file)
+    _event_cache.invalidate(log_file)
+
+    if file_format == "bin":
+        _name_dictionaries.pop(log_file, None)
+        binstore.write_file(log_file, ((location, action, timestamp_to_epoch(timestamp))
+                                       for location, action, timestamp in entries))
+    else:
+        temp_file = _temp_path(log_file)
+        try:
+            with open(temp_file, "w", newline="" if file_format == "csv" else None) as out:
+                if file_format == "json":
+                    _write_json_array(out, entries)
+                else:
+                    _write_entry_stream(out, file_format, entries)
+                binstore.sync_file(out)
+            os.replace(temp_file, log_file)
+            binstore.sync_directory(log_file)
+        except BaseException:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
+
+    if metrics.enabled:
+        metrics.inc("evlog_bytes_written_total", os.path.getsize(log_file), format=file_format)
+
+@metrics.instrumented("target_format")
+def convert_log(location: str, source_format: str, target_format: str, log_dir=None, overwrite=False):
+    """
+    Converts a location's log from one file format to another (e.g. "json" to "bin").
+
+    Events are streamed from the source into a temporary file that replaces the
+    target once complete. Summary rows are not copied; recompute them with
+    calculate_total_time.
+
+    Parameters:
+        location (str): The location whose log is converted.
+        source_format (str): Format to read (txt, csv, json, jsonl, bin).
+        target_format (str): Format to write (txt, csv, json, jsonl, bin).
+        log_dir (str): Directory where log files are stored.
+        overwrite (bool): Replace an existing target file.
+
+    Returns:
+        str or None: Path of the converted log file.
+    """
+    log_dir = _log_dir(log_dir)
+    for file_format in (source_format, target_format):
+        if file_format not in SUPPORTED_FORMATS:
+            log.error("Unsupported file format: %s", file_format)
+            return None
+
+    source_file = os.path.join(log_dir, f"{location}_Tracking.{source_format}")
+    target_file = os.path.join(log_dir, f"{location}_Tracking.{target_format}")
+
+    if not os.path.exists(source_file):
+        log.warning("%s log file not found: %s", source_format.upper(), source_file)
+        return None
+
+    if source_file == target_file:
+        return target_file
+
+    if os.path.exists(target_file) and not overwrite:
+        log.error("Target log file already exists: %s", target_file)
+        return None
 
     try:
-        # Read JSON log file
-        with open(log_file, "r") as file:
-            data = json.load(file)
+        _write_log_file(target_file, target_format, _iter_entries(source_file, source_format))
     except json.JSONDecodeError:
-        log.error(f"Invalid JSON format in {log_file}")
+        log.error("Error decoding JSON in %s", source_file)
         return None
 
-    # Extract timestamps from JSON data
-    for entry in data:
+    _remove_sidecars(target_file)
+    rebuild_index(location, target_format, log_dir)
+
+    log.info("Converted %s to %s", source_file, target_file)
+    return target_file
+
+
+
+### --- Time-Partitioned Logs --- ###
+PARTITION_OPTIONS = ("day", "month")
+
+# <location>_Tracking.<YYYY-MM-DD or YYYY-MM>.<format>
+_PARTITION_PATTERN = re.compile(r"^(?P<location>.+)_Tracking\.(?P<period>\d{4}-\d{2}(?:-\d{2})?)\.(?P<format>[a-z]+)$")
+
+def _log_file_path(log_dir, location, file_format, partition=None, timestamp=None):
+    """Returns the file an event belongs to: the location's log, or its day/month partition."""
+    if not partition:
+        return os.path.join(log_dir, f"{location}_Tracking.{file_format}")
+
+    if partition not in PARTITION_OPTIONS:
+        raise ValueError(f"Unsupported partition option: {partition}")
+
+    if isinstance(timestamp, int) or timestamp.isdigit():
+        timestamp = format_timestamp(timestamp_to_epoch(timestamp))
+    period = timestamp[:10] if partition == "day" else timestamp[:7]
+    return os.path.join(log_dir, f"{location}_Tracking.{period}.{file_format}")
+
+def _period_bounds(period):
+    """Returns the [start, end) epoch seconds covered by a "YYYY-MM-DD" or "YYYY-MM" partition."""
+    if len(period) == 10:
+        start = timestamp_to_epoch(f"{period} 00:00:00")
+        return start, start + 86400
+
+    year, month = int(period[:4]), int(period[5:7])
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return (
+        timestamp_to_epoch(f"{year:04d}-{month:02d}-01 00:00:00"),
+        timestamp_to_epoch(f"{next_year:04d}-{next_month:02d}-01 00:00:00"),
+    )
+
+def _list_partitions(location, file_format, log_dir):
+    """Returns (period, path) for every partition of a location's log, oldest first."""
+    partitions = []
+    prefix = f"{location}_Tracking."
+
+    try:
+        file_names = os.listdir(log_dir)
+    except FileNotFoundError:
+        return partitions
+
+    for file_name in file_names:
+        if not file_name.startswith(prefix):
+            continue
+        match = _PARTITION_PATTERN.match(file_name)
+        if match and match.group("location") == location and match.group("format") == file_format:
+            partitions.append((match.group("period"), os.path.join(log_dir, file_name)))
+
+    # Month partitions ("2025-03") sort before that month's days ("2025-03-01")
+    return sorted(partitions)
+
+def _location_log_files(location, file_format, log_dir):
+    """
+    Returns a location's unpartitioned log (if any) followed by its partitions
+    in period order. Events in different files can overlap in time (e.g. a
+    month partition and that month's days), so readers that pair events merge
+    them by time with _merged_event_times.
+    """
+    log_file = os.path.join(log_dir, f"{location}_Tracking.{file_format}")
+    log_files = [log_file] if os.path.exists(log_file) else []
+    log_files.extend(path for _, path in _list_partitions(location, file_format, log_dir))
+    return log_files
+
+def _merged_event_times(log_files, file_format, actions=None):
+    """
+    Returns the event times of several logs of one location merged into time
+    order (files that do not overlap are simply concatenated). If an ``actions``
+    list is given, the matching actions are appended to it.
+
+    Returns:
+        list or None: Epoch seconds, or None if no file could be read.
+    """
+    sources = []
+    for path in log_files:
+        source_actions = [] if actions is not None else None
         try:
-            dt = datetime.strptime(entry["timestamp"], "%Y-%m-%d %H:%M:%S")
-            event_times.append(dt)
-        except ValueError:
-            log.error(f"Invalid timestamp format in JSON log: {entry}")
+            times = _event_times(path, file_format, source_actions)
+        except json.JSONDecodeError:
+            log.error("Invalid JSON format in %s", path)
+            continue
+        sources.append((times, source_actions))
 
-    # Ensure we have an even number of events (pairs)
-    if len(event_times) % 2 != 0:
-        log.warning(f"Uneven log entries for {location}, ignoring last entry.")
-        event_times = event_times[:-1]  # Ignore the last unpaired entry
+    if not sources:
+        return None
 
-    # Calculate total time
-    total_time = timedelta()
-    for start, end in zip(event_times[0::2], event_times[1::2]):
-        total_time += (end - start)
+    sources = [source for source in sources if len(source[0])]
+    sources.sort(key=lambda source: source[0][0])
+    event_times = []
 
-    total_time_str = str(total_time)
-    log.info(f"Total time logged at {location}: {total_time_str}")
+    if all(previous[0][-1] <= following[0][0] for previous, following in zip(sources, sources[1:])):
+        for times, source_actions in sources:
+            event_times.extend(times)
+            if actions is not None:
+                actions.extend(source_actions)
+        return event_times
+
+    streams = [zip(times, source_actions if actions is not None else times) for times, source_actions in sources]
+    for epoch, action in heapq.merge(*streams, key=lambda item: item[0]):
+        event_times.append(epoch)
+        if actions is not None:
+            actions.append(action)
+    return event_times
+
+def _to_epoch_bound(value):
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return timestamp_to_epoch(value.strftime(TIMESTAMP_FORMAT))
+    return timestamp_to_epoch(value)
 
-    # Append total time to the JSON log file
-    summary_entry = {
-        "location": location,
-        "total_time": total_time_str,
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    }
-    
-    data.append(summary_entry)
+@metrics.instrumented()
+def query_events(location: str, start=None, end=None, file_format="txt", log_dir=None):
+    """
+    Returns a location's events between ``start`` (inclusive) and ``end`` (exclusive), in time order.
 
-    # Write updated log back to JSON file
-    with open(log_file, "w") as file:
-        json.dump(data, file, indent=4)
+    With partitioned logs only the partitions that overlap the range are read.
+    An unpartitioned log for the location is always scanned as well.
+
+    Parameters:
+        location (str): The location to query.
+        start, end (datetime, str or int, optional): Range bounds as datetimes,
+            "%Y-%m-%d %H:%M:%S" text or Unix epoch seconds; None leaves that side open.
+        file_format (str): Format of the log files (txt, csv, json, jsonl, bin).
+        log_dir (str): Directory where log files are stored.
+
+    Returns:
+        list: Event dicts with "location", "action" and "timestamp".
+    """
+    log_dir = _log_dir(log_dir)
+    if file_format not in SUPPORTED_FORMATS:
+        log.error("Unsupported file format: %s", file_format)
+        return []
+
+    start_epoch, end_epoch = _to_epoch_bound(start), _to_epoch_bound(end)
+
+    log_file = os.path.join(log_dir, f"{location}_Tracking.{file_format}")
+    log_files = [log_file] if os.path.exists(log_file) else []
+
+    for period, path in _list_partitions(location, file_format, log_dir):
+        period_start, period_end = _period_bounds(period)
+        if start_epoch is not None and period_end <= start_epoch:
+            continue
+        if end_epoch is not None and period_start >= end_epoch:
+            continue
+        log_files.append(path)
+
+    sources = [_timed_entries(path, file_format) for path in log_files]
+    events = []
+
+    for epoch, (event_location, action, timestamp) in heapq.merge(*sources, key=lambda item: item[0]):
+        if start_epoch is not None and epoch < start_epoch:
+            continue
+        if end_epoch is not None and epoch >= end_epoch:
+            continue
+        events.append({"location": event_location, "action": action, "timestamp": timestamp})
+
+    return events
+
+def _calculate_partitioned_total(location, file_format, log_dir, write_summary=True):
+    """
+    Totals a location with partitioned logs, pairing events across its
+    unpartitioned log (if any) and every partition boundary. The summary row
+    goes to the newest partition.
+    """
+    partitions = _location_log_files(location, file_format, log_dir)
+    event_times = _merged_event_times(partitions, file_format) or []
+
+    total_time = calculate_time(event_times, location, partitions[-1])
+
+    if write_summary:
+        _append_total_time(partitions[-1], file_format, location, total_time)
 
     return total_time
 
 
 
+### --- Buffered Event Logger --- ###
+SUPPORTED_FORMATS = ("txt", "csv", "json", "jsonl", "bin")
+
+class EventLogger:
+    """
+    Logs events through persistent file handles, buffering them in memory and
+    writing them to disk in batches.
+
+    Buffered events are flushed when ``batch_size`` events are pending, when
+    ``flush_interval`` seconds have passed since the first pending event, on
+    ``flush()``/``close()``, and when the interpreter exits.
+
+    Parameters:
+        log_dir (str): Default directory for log files.
+        batch_size (int): Number of pending events that triggers a flush (1 writes through).
+        flush_interval (float): Maximum number of seconds an event stays buffered.
+        max_open_files (int): Number of file handles kept open before the least recently used is closed.
+        timestamp_format (str): "text" ("%Y-%m-%d %H:%M:%S") or "epoch" (integer Unix seconds, see timestamp_to_epoch).
+        partition (str, optional): "day" or "month" to write each location into one file per period
+            (``<location>_Tracking.<period>.<format>``), rolling over automatically.
+        locking (bool, optional): Hold an ``fcntl`` lock per file while writing, for several
+            processes sharing a log directory (default: follow enable_file_locking()).
+    """
+
+    def __init__(self, log_dir=None, batch_size=100, flush_interval=1.0, max_open_files=64, timestamp_format="text",
+                 partition=None, locking=None):
+        log_dir = _log_dir(log_dir)
+        if timestamp_format not in TIMESTAMP_FORMATS:
+            raise ValueError(f"Unsupported timestamp format: {timestamp_format}")
+        if partition and partition not in PARTITION_OPTIONS:
+            raise ValueError(f"Unsupported partition option: {partition}")
+
+        self.log_dir = log_dir
+        self.timestamp_format = timestamp_format
+        self.partition = partition
+        self.locking = locking
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_open_files = max(1, max_open_files)
+
+        self._buffers = OrderedDict()  # (log_file, file_format) -> pending entries
+        self._handles = OrderedDict()  # log_file -> open append handle
+        self._indexes = {}  # log_file -> sidecar index kept in sync with the handle
+        self._known_dirs = set()
+        self._active_partitions = {}  # (log_dir, location, file_format) -> current partition file
+        self._pending = 0
+        self._timer = None
+        self._closed = False
+        self._lock = threading.RLock()
+
+        _open_loggers.add(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @metrics.instrumented()
+    def log(self, location: str, action: str, file_format="txt", log_dir=None, timestamp=None, timestamp_format=None,
+            partition=None):
+        """
+        Buffers an event for the given location, flushing if a batch is complete.
+
+        ``timestamp`` lets callers that queue events record when the event happened
+        rather than when it reached the logger (default: now, in ``timestamp_format``).
+        ``partition`` overrides the logger's partitioning for this event.
+        """
+        if file_format not in SUPPORTED_FORMATS:
+            log.error("Unsupported file format: %s", file_format)
+            return
+
+        if timestamp is None:
+            timestamp = _current_timestamp(timestamp_format or self.timestamp_format)
+
+        log_dir = log_dir or self.log_dir
+        partition = partition or self.partition
+        log_file = _log_file_path(log_dir, location, file_format, partition, timestamp)
+        entry = (location, action, timestamp)
+
+        with self._lock:
+            if self._closed:
+                log.error("EventLogger is closed, dropping event for %s", location)
+                return
+
+            if log_dir not in self._known_dirs:
+                os.makedirs(log_dir, exist_ok=True)
+                self._known_dirs.add(log_dir)
+
+            if partition:
+                self._roll_over((log_dir, location, file_format), log_file)
+
+            key = (log_file, file_format)
+            buffer = self._buffers.get(key)
+            if buffer is None:
+                buffer = self._buffers[key] = []
+            buffer.append(entry)
+            self._pending += 1
+
+            if self._pending >= self.batch_size:
+                self.flush()
+            elif self._timer is None and self.flush_interval:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """Writes every buffered event to disk."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            buffers, self._buffers = self._buffers, OrderedDict()
+            self._pending = 0
+
+            for (log_file, file_format), entries in buffers.items():
+                try:
+                    if file_format == "json":
+                        self._write_json(log_file, entries)
+                    else:
+                        self._write_lines(log_file, file_format, entries)
+                except Exception as e:
+                    log.error("Error writing to %s log: %s", file_format.upper(), e)
+
+    def release(self, log_file):
+        """Flushes pending events and closes the handle for a file that is about to be moved or deleted."""
+        with self._lock:
+            self.flush()
+            if self._indexes.pop(log_file, None) is not None:
+                _save_unsaved_indexes([log_file])
+            handle = self._handles.pop(log_file, None)
+            if handle is not None:
+                handle.close()
+
+    def close(self):
+        """Flushes pending events and closes all open file handles."""
+        with self._lock:
+            if self._closed:
+                return
+            self.flush()
+            for handle in self._handles.values():
+                handle.close()
+            self._handles.clear()
+            _save_unsaved_indexes(list(self._indexes))
+            self._indexes.clear()
+            self._closed = True
+        _open_loggers.discard(self)
+
+    def _roll_over(self, stream, log_file):
+        """Closes the previous partition's handle once a location moves on to a new period."""
+        previous_file = self._active_partitions.get(stream)
+        if previous_file == log_file:
+            return
+
+        self._active_partitions[stream] = log_file
+        if previous_file is not None and not any(key[0] == previous_file for key in self._buffers):
+            self._indexes.pop(previous_file, None)
+            handle = self._handles.pop(previous_file, None)
+            if handle is not None:
+                handle.close()
+
+    def _get_handle(self, log_file, file_format):
+        """Returns an append handle for a log file and its os.fstat() result."""
+        handle = self._handles.get(log_file)
+        if handle is not None:
+            opened = os.fstat(handle.fileno())
+            if _is_same_file(opened, log_file):
+                self._handles.move_to_end(log_file)
+                return handle, opened
+
+            # Deleted or rotated by another program: appending to the old inode would lose the events
+            del self._handles[log_file]
+            self._indexes.pop(log_file, None)
+            handle.close()
+
+        while len(self._handles) >= self.max_open_files:
+            oldest_file, oldest = self._handles.popitem(last=False)
+            self._indexes.pop(oldest_file, None)
+            oldest.close()
+
+        # Unbuffered O_APPEND: each batch is a single write() at the current end of file
+        handle = open(log_file, "ab", buffering=0)
+        self._handles[log_file] = handle
+        return handle, os.fstat(handle.fileno())
+
+    def _write_lines(self, log_file, file_format, entries):
+        locking = _file_locking if self.locking is None else self.locking
+
+        # Text lines are formatted and the batch indexed before taking the lock to keep it short
+        if file_format == "bin":
+            lines = None
+        else:
+            lines = [line.encode("utf-8") for line in _format_entries(file_format, entries)]
+            data = b"".join(lines)
+
+        # Latest entry per action, in order of last occurrence, with its offset from the start of the batch
+        latest = {}
+        offset = 0
+        for position, (location, action, timestamp) in enumerate(entries):
+            latest.pop(action, None)
+            latest[action] = (offset, {"location": location, "action": action, "timestamp": timestamp})
+            offset += binstore.RECORD_SIZE if lines is None else len(lines[position])
+
+        with _file_lock(log_file, locking):
+            handle, before = self._get_handle(log_file, file_format)
+
+            if file_format == "bin":
+                # Names must be interned under the lock so processes agree on their ids
+                data = binstore.pack_records(_bin_records(log_file, entries))
+
+            previous_size = before.st_size
+            view = memoryview(data)
+            while view:
+                view = view[handle.write(view):]
+            after = os.fstat(handle.fileno())
+
+            if (locking and fcntl is not None) or after.st_size == previous_size + len(data):
+                if lines is not None and log_file in _event_cache:
+                    _cache_appended(log_file, stat_key(before), entries, stat=after, tail=lines[-1])
+
+                records = [(previous_size + offset, entry) for offset, entry in latest.values()]
+                index = _update_index(log_file, previous_size, records, self._indexes.get(log_file), after)
+            else:
+                # Another process appended without the lock, so where the batch landed is unknown:
+                # the cache entry is dropped and the saved index left stale for readers to scan
+                _event_cache.invalidate(log_file)
+                index = None
+
+        if index is None:
+            self._indexes.pop(log_file, None)
+        else:
+            self._indexes[log_file] = index
+
+        if metrics.enabled:
+            metrics.inc("evlog_events_written_total", len(entries), format=file_format)
+            metrics.inc("evlog_bytes_written_total", len(data), format=file_format)
+
+    def _write_json(self, log_file, entries):
+        # A JSON array cannot be appended to, so the whole batch shares one rewrite
+        new_entries = [
+            {"location": location, "action": action, "timestamp": timestamp}
+            for location, action, timestamp in entries
+        ]
+
+        with _file_lock(log_file, _file_locking if self.locking is None else self.locking):
+            previous_key = _stat_key_or_none(log_file)
+            data = _load_json_for_write(log_file)
+            data.extend(new_entries)
+            _replace_json(log_file, data)
+            stat = os.stat(log_file)
+            _cache_appended(log_file, previous_key, entries, stat=stat)
+
+        _rebuild_json_index(log_file, data, stat)
+
+        if metrics.enabled:
+            metrics.inc("evlog_events_written_total", len(entries), format="json")
+            metrics.inc("evlog_bytes_written_total", os.path.getsize(log_file), format="json")
+
+def _is_same_file(opened, log_file):
+    """Checks that an open handle (given its os.fstat() result) still refers to the file at ``log_file``."""
+    try:
+        stat = os.stat(log_file)
+    except FileNotFoundError:
+        return False
+    return opened.st_ino == stat.st_ino and opened.st_dev == stat.st_dev
+
+_open_loggers = weakref.WeakSet()
+_default_logger = None
+_default_logger_lock = threading.Lock()
+
+def _get_default_logger():
+    """Returns the shared write-through EventLogger used by the module-level functions."""
+    global _default_logger
+    if _default_logger is None:
+        with _default_logger_lock:
+            if _default_logger is None:
+                _default_logger = EventLogger(batch_size=1, flush_interval=None)
+    return _default_logger
+
+def _release_file(log_file):
+    """Closes any handle the open EventLoggers hold on a file before it is replaced or removed."""
+    for event_logger in list(_open_loggers):
+        event_logger.release(log_file)
+
+@atexit.register
+def _close_open_loggers():
+    for event_logger in list(_open_loggers):
+        event_logger.close()
+
+
+
+### --- Asynchronous Logging --- ###
+_async_writer = None
+
+def enable_async_logging(**options):
+    """
+    Routes log_event through a bounded queue drained by a background writer thread.
+
+    Accepts the keyword arguments of evlog.async_writer.AsyncEventWriter
+    (maxsize, backpressure, batch_size, flush_interval, log_dir).
+
+    Returns:
+        AsyncEventWriter: The active writer, for flush()/wait() and drop counters.
+    """
+    global _async_writer
+    from .async_writer import AsyncEventWriter
+
+    disable_async_logging()
+    _async_writer = AsyncEventWriter(**options)
+    return _async_writer
+
+def disable_async_logging():
+    """Drains the queue, stops the writer thread and returns log_event to synchronous writes."""
+    global _async_writer
+    writer, _async_writer = _async_writer, None
+    if writer is not None:
+        writer.close()
+
+def get_async_writer():
+    """Returns the active AsyncEventWriter, or None when asynchronous logging is disabled."""
+    return _async_writer
+
+
+
 ### --- Unified Functions for Logging & Time Calculation --- ###
-def log_event(location: str, action: str, file_format="txt", log_dir=DEFAULT_LOG_DIR):
-    """Logs an event based on the chosen file format."""
-    if file_format == "txt":
-        log_event_txt(location, action, log_dir)
-    elif file_format == "csv":
-        log_event_csv(location, action, log_dir)
-    elif file_format == "json":
-        log_event_json(location, action, log_dir)
-    else:
-        log.error(f"Unsupported file format: {file_format}")
+@metrics.instrumented()
+def log_event(location: str, action: str, file_format="txt", log_dir=None, timestamp_format="text",
+              partition=None):
+    """
+    Logs an event based on the chosen file format.
+
+    ``timestamp_format="epoch"`` stores integer Unix epoch seconds instead of
+    local "%Y-%m-%d %H:%M:%S" text; readers convert them to local time.
+    ``partition="day"`` or ``"month"`` writes to one file per location and period
+    (see query_events).
+    """
+    log_dir = _log_dir(log_dir)
+    if _async_writer is not None:
+        _async_writer.submit(location, action, file_format, log_dir, timestamp_format=timestamp_format,
+                             partition=partition)
+        return
+
+    if file_format not in SUPPORTED_FORMATS:
+        log.error("Unsupported file format: %s", file_format)
+        return
+
+    _get_default_logger().log(location, action, file_format, log_dir, timestamp_format=timestamp_format,
+                              partition=partition)
+
+@metrics.instrumented()
+def calculate_total_time(location: str, file_format="txt", log_dir=None, incremental=False, write_summary=True):
+    """
+    Calculates total time based on the chosen file format.
+
+    With ``incremental=True`` only events logged since the previous incremental
+    call are parsed; progress is kept in a checkpoint under ``<log_dir>/.evlog/``.
+    With ``write_summary=False`` the total is returned without appending a
+    "Total Time" row to the log file. A location with partitioned logs is
+    totalled across its unpartitioned log and all of its partitions (always a full scan).
+    """
+    log_dir = _log_dir(log_dir)
+    if file_format in SUPPORTED_FORMATS and _list_partitions(location, file_format, log_dir):
+        return _calculate_partitioned_total(location, file_format, log_dir, write_summary)
 
-def calculate_total_time(location: str, file_format="txt", log_dir=DEFAULT_LOG_DIR):
-    """Calculates total time based on the chosen file format."""
     if file_format == "txt":
-        return calculate_total_time_txt(location, log_dir)
+        return calculate_total_time_txt(location, log_dir, incremental, write_summary)
     elif file_format == "csv":
-        return calculate_total_time_csv(location, log_dir)
+        return calculate_total_time_csv(location, log_dir, incremental, write_summary)
     elif file_format == "json":
-        return calculate_total_time_json(location, log_dir)
+        return calculate_total_time_json(location, log_dir, incremental, write_summary)
+    elif file_format == "jsonl":
+        return calculate_total_time_jsonl(location, log_dir, incremental, write_summary)
+    elif file_format == "bin":
+        return calculate_total_time_bin(location, log_dir, incremental, write_summary)
     else:
-        log.error(f"Unsupported file format: {file_format}")
+        log.error("Unsupported file format: %s", file_format)
         return None
 
 def calculate_time(event_times, location, log_file):
-    """Helper function to calculate total time."""
+    """Helper function to calculate total time from datetimes or epoch seconds."""
     if len(event_times) % 2 != 0:
-        log.warning(f"Uneven log entries for {location}, ignoring last entry.")
+        log.warning("Uneven log entries for %s, ignoring last entry.", location)
         event_times = event_times[:-1]
 
-    total_time = timedelta()
-    for start, end in zip(event_times[0::2], event_times[1::2]):
-        total_time += (end - start)
+    if event_times and isinstance(event_times[0], datetime):
+        total_time = timedelta()
+        for start, end in zip(event_times[0::2], event_times[1::2]):
+            total_time += (end - start)
+    else:
+        total_time = timedelta(seconds=paired_total(event_times))
 
     total_time_str = str(total_time)
-    log.info(f"Total time logged at {location}: {total_time_str}")
+    log.info("Total time logged at %s: %s", location, total_time_str)
 
     return total_time
 
+@metrics.instrumented()
+def calculate_group_totals(location: str, group_by="day", file_format="txt", log_dir=None):
+    """
+    Calculates time spent at a location per day, ISO week or action, without
+    appending anything to the log file.
+
+    Parameters:
+        location (str): The location to total (e.g., "gym", "work").
+        group_by (str): "day" or "week" of each arrival, or "action" of the opening event.
+        file_format (str): Format of the log file to read (txt, csv, json, jsonl, bin).
+        log_dir (str): Directory where log files are stored.
+
+    Returns:
+        dict or None: Group label (e.g., "2025-03-16", "2025-W11", "Arrival") to total time.
+    """
+    log_dir = _log_dir(log_dir)
+    if file_format not in SUPPORTED_FORMATS:
+        log.error("Unsupported file format: %s", file_format)
+        return None
+
+    # Pair events across the unpartitioned log and every partition, in time order
+    log_files = _location_log_files(location, file_format, log_dir)
+    if not log_files:
+        log.warning("%s log file not found: %s", file_format.upper(),
+                    os.path.join(log_dir, f"{location}_Tracking.{file_format}"))
+        return None
+
+    actions = []
+    event_times = _merged_event_times(log_files, file_format, actions)
+    if event_times is None:
+        return None
+
+    totals = group_totals(event_times, group_by, actions)
+    return {group: timedelta(seconds=seconds) for group, seconds in totals.items()}
+
 # Extract action events from log files
-def extract_event(location: str, event_type: str, action_filter: str = None, log_dir=DEFAULT_LOG_DIR):
+def _latest_matching(entries, event_type, action_filter):
+    """Returns the first entry in ``entries`` that has event_type (and action_filter)."""
+    for entry in entries:
+        if entry is None or event_type not in entry:
+            continue
+        if action_filter and event_type == "action" and entry.get("action") != action_filter:
+            continue
+        return entry
+    return None
+
+@metrics.instrumented()
+def extract_event(location: str, event_type: str, action_filter: str = None, log_dir=None, file_format="json"):
     """
-    Extracts the latest event of a specific type from a JSON log file.
+    Extracts the latest event of a specific type from a log file.
+
+    The latest "action" (overall and per action) and "total_time" entries are
+    served from a sidecar index under ``<log_dir>/.evlog/`` that is kept current
+    on write. Without a current index, TXT, CSV and JSONL files are scanned
+    backward from the end; JSON files are read and their index rebuilt.
     
     Parameters:
         location (str): The location to track (e.g., "gym", "work").
         event_type (str): The event type to extract (e.g., "action", "total_time").
         action_filter (str, optional): The specific action to filter (e.g., "arrival", "departure").
         log_dir (str): The directory where log files are stored (default: "logs").
+        file_format (str): Format of the log file to read (txt, csv, json, jsonl, bin).
 
     Returns:
         dict or None: A dictionary with extracted event data or None if no matching event is found.
+            TXT and CSV "total_time" rows have no timestamp (None).
     """
-    log_file = os.path.join(log_dir, f"{location}_Tracking.json")
-
-    if not os.path.exists(log_file):
-        log.warning(f"JSON log file not found: {log_file}")
+    log_dir = _log_dir(log_dir)
+    if file_format not in SUPPORTED_FORMATS:
+        log.error("Unsupported file format for extract_event: %s", file_format)
         return None
 
-    try:
-        with open(log_file, "r") as file:
-            data = json.load(file)
-
-            if not data:
-                log.warning(f"No data found in JSON log: {log_file}")
-                return None
-
-            # Filter only entries that contain the requested event type
-            filtered_entries = [entry for entry in data if event_type in entry]
-
-            # If action_filter is specified, filter only matching actions
-            if action_filter and event_type == "action":
-                filtered_entries = [entry for entry in filtered_entries if entry.get("action") == action_filter]
+    log_file = os.path.join(log_dir, f"{location}_Tracking.{file_format}")
+    log_files = _location_log_files(location, file_format, log_dir)
 
-            if not filtered_entries:
-                log.warning(f"No valid '{event_type}' entries found in {log_file} with filter: {action_filter}")
-                return None
-
-            latest_entry = filtered_entries[-1]  # Get the latest valid event
+    if not log_files:
+        log.warning("%s log file not found: %s", file_format.upper(), log_file)
+        return None
+    if log_files == [log_file]:
+        return _extract_from_file(log_file, file_format, event_type, action_filter, warn=True)
+
+    # Partitioned logs: the latest match of each file, compared by time since files can overlap
+    latest_entry, latest_epoch = None, None
+    for path in log_files:
+        entry = _extract_from_file(path, file_format, event_type, action_filter)
+        if entry is None:
+            continue
+        try:
+            epoch = timestamp_to_epoch(entry["timestamp"])
+        except (TypeError, ValueError):
+            epoch = None  # TXT and CSV summary rows have no timestamp: keep file order
+        if latest_entry is None or epoch is None or latest_epoch is None or epoch >= latest_epoch:
+            latest_entry, latest_epoch = entry, epoch
+
+    if latest_entry is None:
+        log.warning("No valid '%s' entries found for %s with filter: %s", event_type, location, action_filter)
+    return latest_entry
+
+def _latest_cached(parsed, event_type, action_filter):
+    """Returns the latest "action" (optionally of one action) or "total_time" entry of a cached log."""
+    if event_type == "total_time":
+        return parsed.summary
+
+    for position in range(parsed.count - 1, -1, -1):
+        if not action_filter or parsed.actions[position] == action_filter:
+            return {"location": parsed.locations[position], "action": parsed.actions[position],
+                    "timestamp": parsed.timestamps[position]}
+    return None
+
+def _extract_from_file(log_file, file_format, event_type, action_filter, warn=False):
+    """Returns the latest matching entry of one log file, using its index when it is current."""
+    index = _load_index(log_file)
+    indexed = _index_is_current(index, log_file) and event_type in ("action", "total_time")
+
+    parsed = None
+    if not indexed and event_type in ("action", "total_time") and log_file in _event_cache:
+        parsed = _event_cache.get(log_file, stat_key(os.stat(log_file)))
+
+    if indexed:
+        if index["size"] == 0:
+            if warn:
+                log.warning("No data found in %s log: %s", file_format.upper(), log_file)
+            return None
+        if action_filter and event_type == "action":
+            item = index["actions"].get(action_filter)
+        else:
+            item = index["latest"].get(event_type)
+        latest_entry = item["entry"] if item else None
+    elif parsed is not None:
+        latest_entry = _latest_cached(parsed, event_type, action_filter)
+    elif file_format == "json":
+        try:
+            with open(log_file, "r") as file:
+                data = json.load(file)
+        except json.JSONDecodeError:
+            log.error("Error decoding JSON in %s", log_file)
+            return None
+
+        if not data:
+            if warn:
+                log.warning("No data found in JSON log: %s", log_file)
+            return None
+
+        _rebuild_json_index(log_file, data)
+        _cached_log(log_file, "json", data)
+        latest_entry = _latest_matching(reversed(data), event_type, action_filter)
+    else:
+        if os.path.getsize(log_file) == 0:
+            if warn:
+                log.warning("No data found in %s log: %s", file_format.upper(), log_file)
+            return None
 
-            return {
-                "location": latest_entry["location"],
-                event_type: latest_entry[event_type],
-                "timestamp": latest_entry["timestamp"]
-            }
+        if file_format == "bin":
+            records = (entry for _, entry in _iter_bin_records_reverse(log_file))
+        else:
+            records = (_parse_record(file_format, line) for line in _iter_lines_reverse(log_file))
+        latest_entry = _latest_matching(records, event_type, action_filter)
 
-    except json.JSONDecodeError:
-        log.error(f"Error decoding JSON in {log_file}")
+    if latest_entry is None:
+        if warn:
+            log.warning("No valid '%s' entries found in %s with filter: %s", event_type, log_file, action_filter)
         return None
 
+    return {
+        "location": latest_entry["location"],
+        event_type: latest_entry[event_type],
+        "timestamp": latest_entry.get("timestamp")
+    }
+
 # Erase old log files 
-def cleanup_old_logs(days=30, log_dir=DEFAULT_LOG_DIR):
+@metrics.instrumented()
+def cleanup_old_logs(days=30, log_dir=None):
     """
     Deletes log files older than the specified number of days.
+
+    Time partitions are deleted once the whole period they cover is older than
+    the retention window, whatever their modification time; other files are
+    deleted by modification time.
     
     Parameters:
         days (int): Number of days to retain logs.
         log_dir (str): Directory where log files are stored.
     """
+    log_dir = _log_dir(log_dir)
     threshold_date = datetime.now() - timedelta(days=days)
+    threshold_epoch = _to_epoch_bound(threshold_date)
 
     for file_name in os.listdir(log_dir):
         file_path = os.path.join(log_dir, file_name)
+        if file_name.endswith(".bin.names"):
+            continue  # Removed together with its binary log
         if os.path.isfile(file_path):
-            file_modified_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-            if file_modified_time < threshold_date:
+            partition = _PARTITION_PATTERN.match(file_name)
+            if partition and partition.group("format") in SUPPORTED_FORMATS:
+                expired = _period_bounds(partition.group("period"))[1] <= threshold_epoch
+            else:
+                expired = datetime.fromtimestamp(os.path.getmtime(file_path)) < threshold_date
+            if expired:
                 try:
+                    _release_file(file_path)
                     os.remove(file_path)
-                    log.info(f"Deleted old log file: {file_path}")
+                    _remove_sidecars(file_path)
+                    log.info("Deleted old log file: %s", file_path)
                 except Exception as e:
-                    log.error(f"Error deleting log file {file_path}: {e}")
+                    log.error("Error deleting log file %s: %s", file_path, e)
 
 # create a summary report 
-def generate_summary_report(log_dir=DEFAULT_LOG_DIR, file_format="json"):
+REPORT_EXECUTORS = ("thread", "process")
+
+def _summarize_location(location, file_format, log_dir, incremental, group_by, read_only):
+    """Computes one location's summary entry (module level so process pools can pickle it)."""
+    if group_by:
+        totals = calculate_group_totals(location, group_by, file_format, log_dir)
+        if totals:
+            return {group: str(total) for group, total in totals.items()}
+        return None
+
+    total_time = calculate_total_time(location, file_format, log_dir, incremental, write_summary=not read_only)
+    if total_time:
+        return str(total_time)
+    return None
+
+@metrics.instrumented()
+def generate_summary_report(log_dir=None, file_format="json", incremental=False, group_by=None,
+                            workers=None, executor="thread", read_only=False):
     """
     Generates a summary report of total time spent at different locations.
     
     Parameters:
         log_dir (str): Directory where log files are stored.
-        file_format (str): Format of the log files to process (txt, csv, json).
+        file_format (str): Format of the log files to process (txt, csv, json, jsonl, bin).
+        incremental (bool): Only parse events logged since the previous incremental report.
+        group_by (str, optional): Break each location down by "day", "week" or "action"
+            (see calculate_group_totals); nothing is appended to the log files.
+        workers (int, optional): Number of locations processed in parallel (default: one at a time).
+        executor (str): "thread" or "process" pool used when workers > 1.
+        read_only (bool): Do not append a "Total Time" row to each log file.
     
     Returns:
-        dict: A dictionary with location names and total time spent.
+        dict: A dictionary with location names and total time spent
+            (or, with group_by, a dictionary of group totals per location),
+            ordered by location name.
     """
-    summary = {}
+    log_dir = _log_dir(log_dir)
+    if executor not in REPORT_EXECUTORS:
+        raise ValueError(f"Unsupported executor: {executor}")
 
+    suffix = f"_Tracking.{file_format}"
+    locations = set()
     for file_name in os.listdir(log_dir):
-        if file_name.endswith(f"_Tracking.{file_format}"):
-            location = file_name.replace(f"_Tracking.{file_format}", "")
-            total_time = calculate_total_time(location, file_format, log_dir)
-            if total_time:
-                summary[location] = str(total_time)
+        if file_name.endswith(suffix):
+            locations.add(file_name[:-len(suffix)])
+        else:
+            partition = _PARTITION_PATTERN.match(file_name)
+            if partition and partition.group("format") == file_format:
+                locations.add(partition.group("location"))
+    locations = sorted(locations)
+
+    task = functools.partial(
+        _summarize_location,
+        file_format=file_format,
+        log_dir=log_dir,
+        incremental=incremental,
+        group_by=group_by,
+        read_only=read_only,
+    )
+
+    if workers and workers > 1 and len(locations) > 1:
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        chunksize = max(1, len(locations) // (workers * 4))
+        with pool_class(max_workers=workers) as pool:
+            results = list(pool.map(task, locations, chunksize=chunksize))
+    else:
+        results = [task(location) for location in locations]
 
-    log.info(f"Generated summary report: {summary}")
+    # pool.map keeps input order, so the report is the same for any worker count
+    summary = {location: result for location, result in zip(locations, results) if result}
+
+    log.info("Generated summary report: %s", summary)
     return summary
 
 # Merge Log files ( example, merge work location and time punches files )
-def merge_logs(locations: list, output_format="json", log_dir=DEFAULT_LOG_DIR):
+def _timed_entries(log_file, file_format):
+    """
+    Yields (epoch, entry) pairs for the k-way merge, skipping events that
+    cannot be ordered. A file that is already in the parsed-event cache is
+    served from it; any other file is streamed without being cached.
     """
-    Merges logs from multiple locations into a single file.
+    if log_file in _event_cache:
+        parsed = _event_cache.get(log_file, stat_key(os.stat(log_file)))
+        if parsed is not None:
+            yield from parsed.entries()
+            return
+
+    try:
+        for entry in _iter_entries(log_file, file_format):
+            try:
+                yield timestamp_to_epoch(entry[2]), entry
+            except (TypeError, ValueError):
+                log.error("Invalid timestamp format in %s: %s", log_file, entry)
+    except json.JSONDecodeError:
+        log.error("Error decoding JSON in %s, skipping the rest of the file", log_file)
+
+MERGE_FAN_IN = 64  # Most source files merge_logs reads at once
+
+def _merged_entries(sources, run_prefix, runs):
+    """
+    Returns a time-ordered (epoch, entry) stream over (log_file, file_format)
+    sources. With more than MERGE_FAN_IN sources, consecutive groups are first
+    merged into intermediate JSONL runs named after ``run_prefix`` (recorded in
+    ``runs`` for the caller to remove), so no more than MERGE_FAN_IN files are
+    open at once. Ties keep the order of ``sources``.
+    """
+    while len(sources) > MERGE_FAN_IN:
+        next_sources = []
+        for start in range(0, len(sources), MERGE_FAN_IN):
+            group = sources[start:start + MERGE_FAN_IN]
+            if len(group) == 1:
+                next_sources.extend(group)
+                continue
+            run_file = f"{run_prefix}.run{len(runs)}"
+            runs.append(run_file)
+            streams = [_timed_entries(log_file, file_format) for log_file, file_format in group]
+            with open(run_file, "w") as out:
+                _write_entry_stream(out, "jsonl", (entry for _, entry in heapq.merge(*streams, key=lambda item: item[0])))
+            next_sources.append((run_file, "jsonl"))
+        sources = next_sources
+
+    streams = [_timed_entries(log_file, file_format) for log_file, file_format in sources]
+    return heapq.merge(*streams, key=lambda item: item[0])
+
+def _write_json_array(handle, entries):
+    """Streams entries to a file laid out exactly like json.dump(data, file, indent=4)."""
+    first = True
+    for location, action, timestamp in entries:
+        entry = {"location": location, "action": action, "timestamp": timestamp}
+        handle.write("[\n    " if first else ",\n    ")
+        handle.write(json.dumps(entry, indent=4).replace("\n", "\n    "))
+        first = False
+    handle.write("[]" if first else "\n]")
+
+@metrics.instrumented("output_format")
+def merge_logs(locations: list, output_format="json", log_dir=None, input_format=None):
+    """
+    Merges logs from multiple locations into a single file, ordered by time.
+
+    Each source file (including time partitions) is read lazily and combined
+    with a heap-based k-way merge, so memory grows with the number of source
+    files rather than the number of events. More than MERGE_FAN_IN source files
+    are merged in several passes through temporary files, keeping the number of
+    open files bounded. Summary rows ("Total Time") are not carried over.
 
     Parameters:
         locations (list): List of locations whose logs need merging.
-        output_format (str): Output file format (txt, csv, json).
+        output_format (str): Output file format (txt, csv, json, jsonl, bin).
         log_dir (str): Directory where log files are stored.
+        input_format (str or list, optional): Format(s) of the files to merge. Defaults to
+            output_format; "auto" merges every format found for each location.
     
     Returns:
         str: Path to the merged log file.
     """
-    merged_data = []
+    log_dir = _log_dir(log_dir)
+    if output_format not in SUPPORTED_FORMATS:
+        log.error("Unsupported file format: %s", output_format)
+        return None
+
+    if input_format is None:
+        input_formats = [output_format]
+    elif input_format == "auto":
+        input_formats = list(SUPPORTED_FORMATS)
+    elif isinstance(input_format, str):
+        input_formats = [input_format]
+    else:
+        input_formats = list(input_format)
+
     output_file = os.path.join(log_dir, f"Merged_Logs.{output_format}")
+    sources = []
 
     for location in locations:
-        log_file = os.path.join(log_dir, f"{location}_Tracking.{output_format}")
-
-        if not os.path.exists(log_file):
-            log.warning(f"Log file not found: {log_file}")
+        log_files = [
+            (log_file, file_format)
+            for file_format in input_formats
+            for log_file in _location_log_files(location, file_format, log_dir)
+        ]
+
+        if not log_files:
+            log.warning("Log file not found for %s in formats: %s", location, input_formats)
             continue
 
-        if output_format == "json":
-            with open(log_file, "r") as file:
-                data = json.load(file)
-                merged_data.extend(data)
-
-    if output_format == "json":
-        with open(output_file, "w") as file:
-            json.dump(merged_data, file, indent=4)
+        sources.extend(log_files)
 
-    log.info(f"Merged logs saved to: {output_file}")
+    # Ties keep the order of the locations list
+    runs = []
+    try:
+        merged = _merged_entries(sources, _temp_path(output_file), runs)
+        _write_log_file(output_file, output_format, (entry for _, entry in merged))
+    finally:
+        for run_file in runs:
+            if os.path.exists(run_file):
+                os.remove(run_file)
+
+    log.info("Merged logs saved to: %s", output_file)
     return output_file
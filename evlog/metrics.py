@@ -0,0 +1,325 @@
+"""
+Lightweight metrics for evlog operations.
+
+When enabled, evlog counts calls, errors and latency (as a histogram) per
+public function and file format, plus bytes read and written and events parsed
+and written per format. Snapshots can be exported to pluggable sinks such as
+InMemorySink or PrometheusFileSink. While disabled (the default) every hook is
+a single flag check.
+"""
+import os
+import time
+import atexit
+import inspect
+import functools
+import threading
+import contextlib
+from collections import deque
+
+# Latency histogram bucket upper bounds in seconds
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+enabled = False
+
+_lock = threading.Lock()
+_counters = {}  # series -> value
+_histograms = {}  # series -> [count, sum, bucket counts...]
+_sinks = []
+_exporter = None
+
+
+def _series(name, labels):
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{key}="{labels[key]}"' for key in sorted(labels)) + "}"
+
+
+def parse_series(series):
+    """Splits a series name such as ``evlog_calls_total{format="txt"}`` into (name, labels dict)."""
+    name, _, labels = series.partition("{")
+    pairs = (item.split("=", 1) for item in labels.rstrip("}").split(",") if item)
+    return name, {key: value.strip('"') for key, value in pairs}
+
+
+def inc(name, value=1, **labels):
+    """Adds ``value`` to a counter (no-op while metrics are disabled)."""
+    if not enabled:
+        return
+    series = _series(name, labels)
+    with _lock:
+        _counters[series] = _counters.get(series, 0) + value
+
+
+def observe(name, value, **labels):
+    """Records one observation (in seconds) in a latency histogram (no-op while disabled)."""
+    if not enabled:
+        return
+    series = _series(name, labels)
+    with _lock:
+        histogram = _histograms.get(series)
+        if histogram is None:
+            histogram = _histograms[series] = [0, 0.0] + [0] * len(LATENCY_BUCKETS)
+        histogram[0] += 1
+        histogram[1] += value
+        for position, bound in enumerate(LATENCY_BUCKETS):
+            if value <= bound:
+                histogram[2 + position] += 1
+                break
+
+
+def instrumented(format_arg="file_format"):
+    """
+    Decorator counting calls, errors and latency of a public function, labelled
+    with the function name and the value of its ``format_arg`` parameter.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        parameters = list(signature.parameters)
+        position = parameters.index(format_arg) if format_arg in parameters else None
+        default = signature.parameters[format_arg].default if position is not None else ""
+        if default is inspect.Parameter.empty:
+            default = ""
+        function_name = func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+
+            if position is None:
+                file_format = ""
+            elif format_arg in kwargs:
+                file_format = kwargs[format_arg]
+            elif len(args) > position:
+                file_format = args[position]
+            else:
+                file_format = default
+            if not isinstance(file_format, str):
+                file_format = ",".join(file_format)  # e.g. a list of input formats
+
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except BaseException:
+                inc("evlog_errors_total", function=function_name, format=file_format)
+                raise
+            finally:
+                inc("evlog_calls_total", function=function_name, format=file_format)
+                observe("evlog_call_duration_seconds", time.perf_counter() - started,
+                        function=function_name, format=file_format)
+
+        return wrapper
+    return decorator
+
+
+def snapshot():
+    """
+    Returns the current metrics as plain dicts keyed by Prometheus-style series names:
+    ``{"counters": {series: value}, "histograms": {series: {"count", "sum", "buckets"}}}``
+    where ``buckets`` maps each upper bound to a cumulative count.
+    """
+    with _lock:
+        counters = dict(_counters)
+        histograms = {series: list(values) for series, values in _histograms.items()}
+
+    result = {"counters": counters, "histograms": {}}
+    for series, values in histograms.items():
+        cumulative, buckets = 0, {}
+        for bound, count in zip(LATENCY_BUCKETS, values[2:]):
+            cumulative += count
+            buckets[bound] = cumulative
+        result["histograms"][series] = {"count": values[0], "sum": values[1], "buckets": buckets}
+    return result
+
+
+def difference(after, before):
+    """Returns the change between two snapshots (series that did not change are left out)."""
+    result = {"counters": {}, "histograms": {}}
+    for series, value in after["counters"].items():
+        change = value - before["counters"].get(series, 0)
+        if change:
+            result["counters"][series] = change
+    for series, histogram in after["histograms"].items():
+        previous = before["histograms"].get(series)
+        if previous is None:
+            result["histograms"][series] = histogram
+        elif histogram["count"] != previous["count"]:
+            result["histograms"][series] = {
+                "count": histogram["count"] - previous["count"],
+                "sum": histogram["sum"] - previous["sum"],
+                "buckets": {bound: count - previous["buckets"][bound] for bound, count in histogram["buckets"].items()},
+            }
+    return result
+
+
+def reset():
+    """Clears every counter and histogram."""
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+
+def format_prometheus(metrics):
+    """Formats a snapshot in the Prometheus text exposition format."""
+    lines = []
+    typed = set()
+
+    for series, value in sorted(metrics["counters"].items()):
+        name = series.split("{", 1)[0]
+        if name not in typed:
+            lines.append(f"# TYPE {name} counter")
+            typed.add(name)
+        lines.append(f"{series} {value}")
+
+    for series, histogram in sorted(metrics["histograms"].items()):
+        name, _, labels = series.partition("{")
+        labels = labels.rstrip("}")
+        if name not in typed:
+            lines.append(f"# TYPE {name} histogram")
+            typed.add(name)
+        prefix = labels + "," if labels else ""
+        for bound, count in histogram["buckets"].items():
+            lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {count}')
+        lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {histogram["count"]}')
+        suffix = "{" + labels + "}" if labels else ""
+        lines.append(f"{name}_sum{suffix} {histogram['sum']}")
+        lines.append(f"{name}_count{suffix} {histogram['count']}")
+
+    return "\n".join(lines) + "\n"
+
+
+class InMemorySink:
+    """Keeps the most recent exported snapshots in memory."""
+
+    def __init__(self, maxlen=100):
+        self.snapshots = deque(maxlen=maxlen)
+
+    @property
+    def latest(self):
+        return self.snapshots[-1] if self.snapshots else None
+
+    def export(self, metrics):
+        self.snapshots.append(metrics)
+
+
+class PrometheusFileSink:
+    """
+    Writes snapshots to a file in the Prometheus text format (for example for
+    node_exporter's textfile collector). The file is replaced atomically.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def export(self, metrics):
+        temp_file = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_file, "w") as file:
+            file.write(format_prometheus(metrics))
+        os.replace(temp_file, self.path)
+
+
+def export():
+    """Sends a snapshot to every configured sink."""
+    if not _sinks:
+        return
+    metrics = snapshot()
+    for sink in list(_sinks):
+        sink.export(metrics)
+
+
+class _Exporter(threading.Thread):
+    def __init__(self, interval):
+        super().__init__(name="evlog-metrics", daemon=True)
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            export()
+
+
+def enable(*sinks, export_interval=None):
+    """
+    Starts collecting metrics.
+
+    Parameters:
+        sinks: Objects with an ``export(snapshot)`` method, e.g. InMemorySink or PrometheusFileSink.
+        export_interval (float, optional): Seconds between background exports to the sinks.
+            Sinks also receive a final snapshot at exit.
+    """
+    global enabled, _exporter
+    _sinks.extend(sinks)
+    enabled = True
+
+    if export_interval and _exporter is None:
+        _exporter = _Exporter(export_interval)
+        _exporter.start()
+    atexit.unregister(export)
+    atexit.register(export)
+
+
+def disable():
+    """Stops collecting metrics, exports a last snapshot and detaches the sinks."""
+    global enabled, _exporter
+    enabled = False
+    if _exporter is not None:
+        _exporter.stopped.set()
+        _exporter = None
+    export()
+    _sinks.clear()
+    atexit.unregister(export)
+
+
+class Profile:
+    """Result of a profile() block: the metrics recorded while it ran."""
+
+    def __init__(self):
+        self.metrics = None
+        self.elapsed = None
+
+    def report(self):
+        """Returns a table of calls, total and mean time per function and format."""
+        rows = []
+        for series, histogram in sorted(self.metrics["histograms"].items()):
+            if not series.startswith("evlog_call_duration_seconds"):
+                continue
+            _, labels = parse_series(series)
+            mean = histogram["sum"] / histogram["count"] if histogram["count"] else 0.0
+            rows.append(
+                f"{labels.get('function', ''):<28}{labels.get('format', ''):<10}"
+                f"{histogram['count']:>8}{histogram['sum'] * 1000:>12.3f}{mean * 1000:>10.3f}"
+            )
+
+        header = f"{'function':<28}{'format':<10}{'calls':>8}{'total ms':>12}{'mean ms':>10}"
+        lines = [header] + rows
+        for series, value in sorted(self.metrics["counters"].items()):
+            if not series.startswith(("evlog_calls_total", "evlog_errors_total")):
+                lines.append(f"{series} {value}")
+        lines.append(f"elapsed: {self.elapsed * 1000:.3f} ms")
+        return "\n".join(lines)
+
+
+@contextlib.contextmanager
+def profile():
+    """
+    Records evlog metrics for the duration of a ``with`` block, enabling
+    collection temporarily if needed. Activity from other threads during the
+    block is included.
+
+    Example:
+        with evlog.profile() as result:
+            evlog.generate_summary_report(log_dir="logs")
+        print(result.report())
+    """
+    global enabled
+    was_enabled = enabled
+    enabled = True
+    result = Profile()
+    before = snapshot()
+    started = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result.elapsed = time.perf_counter() - started
+        result.metrics = difference(snapshot(), before)
+        enabled = was_enabled
@@ -0,0 +1,30 @@
+"""
+Command-line tool that converts JSON-array logs to the JSON Lines format.
+
+Usage:
+    python -m evlog.migrate [--log-dir LOG_DIR] [--remove-source] [LOCATION ...]
+"""
+import argparse
+
+from .logger import migrate_json_to_jsonl
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m evlog.migrate",
+        description="Convert <location>_Tracking.json files to append-only <location>_Tracking.jsonl files.",
+    )
+    parser.add_argument("locations", nargs="*", help="Locations to migrate (default: all JSON logs).")
+    parser.add_argument("--log-dir", default=None,
+                        help="Directory where log files are stored (default: $EVLOG_LOG_DIR or ./logs).")
+    parser.add_argument("--remove-source", action="store_true", help="Delete the JSON files after migrating.")
+    args = parser.parse_args(argv)
+
+    migrated = migrate_json_to_jsonl(args.log_dir, args.locations or None, args.remove_source)
+    for path in migrated:
+        print(path)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,12 @@
+import pytest
+
+import evlog
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    """An empty log directory, with evlog's diagnostics and cache isolated per test."""
+    evlog.configure(log_file=str(tmp_path / "evlog.log"))
+    evlog.clear_cache()
+    yield str(tmp_path / "logs")
+    evlog.clear_cache()
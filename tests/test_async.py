@@ -0,0 +1,65 @@
+import threading
+import time
+
+import pytest
+
+import evlog
+
+
+def _stalled_writer(log_dir, backpressure):
+    """An AsyncEventWriter whose thread has taken event "0" and waits until the returned event is set."""
+    writer = evlog.AsyncEventWriter(log_dir, maxsize=3, backpressure=backpressure)
+    release = threading.Event()
+    log = writer._event_logger.log
+
+    def stalled_log(*args, **kwargs):
+        release.wait(10)
+        return log(*args, **kwargs)
+
+    writer._event_logger.log = stalled_log
+    writer.submit("Gym", "0", "jsonl", timestamp="2025-01-01 08:00:00")
+    deadline = time.monotonic() + 10
+    while writer.stats()["queued"] and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return writer, release
+
+
+def _actions(log_dir):
+    return [event["action"] for event in evlog.query_events("Gym", file_format="jsonl", log_dir=log_dir)]
+
+
+@pytest.mark.parametrize("backpressure, accepted, written", [
+    ("drop_newest", [True, True, True, False, False], ["0", "1", "2", "3"]),
+    ("drop_oldest", [True, True, True, True, True], ["0", "3", "4", "5"]),
+])
+def test_full_queue_drops_events_by_policy(log_dir, backpressure, accepted, written):
+    writer, release = _stalled_writer(log_dir, backpressure)
+    try:
+        results = [writer.submit("Gym", str(number), "jsonl", timestamp=f"2025-01-01 09:00:0{number}") for number in range(1, 6)]
+        assert results == accepted
+        assert writer.stats()["queued"] == 3
+    finally:
+        release.set()
+    assert writer.flush(10)
+
+    dropped = {"drop_oldest": 0, "drop_newest": 0, backpressure: 2}
+    assert writer.stats() == {
+        "queued": 0,
+        "submitted": 1 + accepted.count(True),
+        "written": 4,
+        "dropped_oldest": dropped["drop_oldest"],
+        "dropped_newest": dropped["drop_newest"],
+    }
+    assert writer.dropped == 2
+    assert _actions(log_dir) == written
+    writer.close()
+
+
+def test_flush_writes_queued_events_to_disk(log_dir):
+    writer = evlog.AsyncEventWriter(log_dir, flush_interval=60)
+    for number in range(100):
+        writer.submit("Gym", str(number), "jsonl", timestamp=f"2025-01-01 09:{number // 60:02d}:{number % 60:02d}")
+
+    assert writer.flush(10)
+    assert _actions(log_dir) == [str(number) for number in range(100)]
+    writer.close()
@@ -0,0 +1,29 @@
+import os
+
+import pytest
+
+import evlog
+
+FORMATS = ("txt", "csv", "json", "jsonl")
+
+
+@pytest.mark.parametrize("file_format", FORMATS)
+def test_conversion_to_bin_and_back_keeps_every_event(log_dir, file_format):
+    with evlog.EventLogger(log_dir) as logger:
+        for number in range(50):
+            logger.log("Gym", "Arrival" if number % 2 == 0 else "Departure", file_format,
+                       timestamp=f"2025-01-01 {8 + number // 60:02d}:{number % 60:02d}:00")
+    evlog.calculate_total_time("Gym", file_format, log_dir)
+    events = evlog.query_events("Gym", file_format=file_format, log_dir=log_dir)
+
+    bin_file = evlog.convert_log("Gym", file_format, "bin", log_dir)
+    assert os.path.getsize(bin_file) == 50 * 24
+    assert os.path.exists(bin_file + ".names")
+    assert evlog.query_events("Gym", file_format="bin", log_dir=log_dir) == events
+    assert str(evlog.calculate_total_time("Gym", "bin", log_dir)) == "0:25:00"
+    assert evlog.extract_event("Gym", "total_time", log_dir=log_dir, file_format="bin")["total_time"] == "0:25:00"
+
+    os.remove(os.path.join(log_dir, f"Gym_Tracking.{file_format}"))
+    evlog.convert_log("Gym", "bin", file_format, log_dir)
+    assert evlog.query_events("Gym", file_format=file_format, log_dir=log_dir) == events
+    assert evlog.extract_event("Gym", "action", log_dir=log_dir, file_format=file_format) == events[-1]
@@ -0,0 +1,51 @@
+import os
+
+import evlog
+
+
+def _write(path, mode, *lines):
+    with open(path, mode) as file:
+        file.writelines(f"{action} logged to Gym: {timestamp}\n" for action, timestamp in lines)
+
+
+def test_append_by_another_writer_parses_only_new_lines(log_dir):
+    os.makedirs(log_dir)
+    log_file = os.path.join(log_dir, "Gym_Tracking.txt")
+    _write(log_file, "w", ("Arrival", "2025-01-01 10:00:00"), ("Departure", "2025-01-01 10:30:00"))
+    assert str(evlog.calculate_total_time("Gym", "txt", log_dir, write_summary=False)) == "0:30:00"
+
+    extends = evlog.cache_stats()["extends"]
+    _write(log_file, "a", ("Arrival", "2025-01-01 12:00:00"), ("Departure", "2025-01-01 12:15:00"))
+
+    assert str(evlog.calculate_total_time("Gym", "txt", log_dir, write_summary=False)) == "0:45:00"
+    assert evlog.cache_stats()["extends"] == extends + 1
+
+
+def test_in_place_rewrite_that_grows_the_file_is_parsed_again(log_dir):
+    os.makedirs(log_dir)
+    log_file = os.path.join(log_dir, "Gym_Tracking.txt")
+    _write(log_file, "w", ("Arrival", "2025-01-01 10:00:00"), ("Departure", "2025-01-01 11:10:00"))
+    assert str(evlog.calculate_total_time("Gym", "txt", log_dir, write_summary=False)) == "1:10:00"
+
+    inode = os.stat(log_file).st_ino
+    with open(log_file, "r+") as file:  # Same inode, corrected timestamps, larger file
+        file.truncate()
+        file.writelines([
+            "Arrival logged to Gym: 2025-01-01 10:00:00\n",
+            "Departure logged to Gym: 2025-01-01 10:40:00\n",
+            "Arrival logged to Gym: 2025-01-01 12:00:00\n",
+        ])
+    assert os.stat(log_file).st_ino == inode
+
+    assert str(evlog.calculate_total_time("Gym", "txt", log_dir, write_summary=False)) == "0:40:00"
+
+
+def test_events_written_through_evlog_extend_the_cached_entry(log_dir):
+    with evlog.EventLogger(log_dir, batch_size=1) as logger:
+        logger.log("Gym", "Arrival", "jsonl", timestamp="2025-01-01 10:00:00")
+        assert evlog.calculate_total_time("Gym", "jsonl", log_dir, write_summary=False).total_seconds() == 0
+
+        logger.log("Gym", "Departure", "jsonl", timestamp="2025-01-01 10:20:00")
+        misses = evlog.cache_stats()["misses"]
+        assert str(evlog.calculate_total_time("Gym", "jsonl", log_dir, write_summary=False)) == "0:20:00"
+        assert evlog.cache_stats()["misses"] == misses
@@ -0,0 +1,36 @@
+import os
+
+import pytest
+
+import evlog
+
+FORMATS = ("txt", "csv", "json", "jsonl", "bin")
+
+
+def _log(log_dir, file_format, *timestamps):
+    with evlog.EventLogger(log_dir, batch_size=1) as logger:
+        for position, timestamp in enumerate(timestamps):
+            logger.log("Gym", "Departure" if position % 2 else "Arrival", file_format, timestamp=timestamp)
+
+
+@pytest.mark.parametrize("file_format", FORMATS)
+def test_incremental_total_continues_from_the_checkpoint(log_dir, file_format):
+    _log(log_dir, file_format, "2025-01-01 10:00:00", "2025-01-01 10:30:00", "2025-01-01 11:00:00")
+    assert str(evlog.calculate_total_time("Gym", file_format, log_dir, incremental=True)) == "0:30:00"
+
+    _log(log_dir, file_format, "2025-01-01 11:15:00")
+    assert str(evlog.calculate_total_time("Gym", file_format, log_dir, incremental=True)) == "0:45:00"
+
+
+@pytest.mark.parametrize("file_format", FORMATS)
+def test_incremental_total_starts_over_when_the_log_was_rewritten(log_dir, file_format):
+    _log(log_dir, file_format, "2025-01-01 08:00:00", "2025-01-01 18:00:00")
+    assert str(evlog.calculate_total_time("Gym", file_format, log_dir, incremental=True)) == "10:00:00"
+
+    # Emptied in place, so the inode stays the same, then logged to again
+    log_file = os.path.join(log_dir, f"Gym_Tracking.{file_format}")
+    open(log_file, "w").close()
+    _log(log_dir, file_format, "2025-01-02 08:00:00", "2025-01-02 08:30:00", "2025-01-02 09:00:00", "2025-01-02 09:30:00")
+
+    assert str(evlog.calculate_total_time("Gym", file_format, log_dir, incremental=True)) == "1:00:00"
+    assert str(evlog.calculate_total_time("Gym", file_format, log_dir, write_summary=False)) == "1:00:00"
@@ -0,0 +1,35 @@
+import logging
+
+import evlog
+
+
+def test_configure_moves_diagnostics_to_the_new_log_file(tmp_path, monkeypatch):
+    # Without pytest's capture handler, as in an application that leaves logging to evlog
+    monkeypatch.setattr(logging.getLogger(), "handlers", [])
+    first, second = tmp_path / "first.log", tmp_path / "second.log"
+
+    evlog.configure(log_file=str(first))
+    evlog.log_event("Gym", "Arrival", "yaml", str(tmp_path / "logs"))
+    evlog.configure(log_file=str(second))
+    evlog.log_event("Work", "Arrival", "yaml", str(tmp_path / "logs"))
+
+    assert "Unsupported file format: yaml" in first.read_text()
+    assert "Work" not in first.read_text()
+    assert "Unsupported file format: yaml" in second.read_text()
+    evlog.configure(log_file=str(tmp_path / "evlog.log"))  # Closes the handler on second.log
+
+
+def test_configure_leaves_application_logging_alone(tmp_path):
+    root = logging.getLogger()
+    handler = logging.FileHandler(str(tmp_path / "app.log"))
+    evlog.configure(log_file=str(tmp_path / "evlog.log"))
+    root.addHandler(handler)
+    try:
+        evlog.configure(log_file=str(tmp_path / "evlog.log"))
+        evlog.log_event("Gym", "Arrival", "yaml", str(tmp_path / "logs"))
+        handler.flush()
+        assert "Unsupported file format: yaml" in (tmp_path / "app.log").read_text()
+        assert handler in root.handlers
+    finally:
+        root.removeHandler(handler)
+        handler.close()
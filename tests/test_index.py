@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+import evlog
+from evlog.logger import _format_entries, _index_path, _save_unsaved_indexes
+
+LINE_FORMATS = ("txt", "csv", "jsonl")
+
+
+def _foreign_line(file_format, action, timestamp):
+    return _format_entries(file_format, [("Gym", action, timestamp)])[0]
+
+
+@pytest.mark.parametrize("file_format", LINE_FORMATS)
+def test_stale_index_falls_back_to_scanning(log_dir, file_format):
+    with evlog.EventLogger(log_dir, batch_size=1) as logger:
+        logger.log("Gym", "Arrival", file_format, timestamp="2025-01-01 08:00:00")
+    _save_unsaved_indexes()
+    log_file = os.path.join(log_dir, f"Gym_Tracking.{file_format}")
+    assert os.path.exists(_index_path(log_file))
+
+    # Appended by a writer that does not maintain the index
+    with open(log_file, "a") as file:
+        file.write(_foreign_line(file_format, "Departure", "2025-01-01 09:00:00"))
+
+    latest = evlog.extract_event("Gym", "action", log_dir=log_dir, file_format=file_format)
+    assert latest == {"location": "Gym", "action": "Departure", "timestamp": "2025-01-01 09:00:00"}
+
+
+@pytest.mark.parametrize("file_format", LINE_FORMATS)
+def test_unlocked_concurrent_append_does_not_misplace_the_index(log_dir, file_format):
+    log_file = os.path.join(log_dir, f"Gym_Tracking.{file_format}")
+    with evlog.EventLogger(log_dir, batch_size=1, locking=False) as logger:
+        logger.log("Gym", "Arrival", file_format, timestamp="2025-01-01 08:00:00")
+        assert str(evlog.calculate_total_time("Gym", file_format, log_dir, write_summary=False)) == "0:00:00"
+
+        get_handle = logger._get_handle
+
+        def get_handle_then_append_elsewhere(path, handle_format):
+            # Another process appends between the size check and the write
+            handle, before = get_handle(path, handle_format)
+            with open(path, "a") as file:
+                file.write(_foreign_line(file_format, "Lunch", "2025-01-01 12:00:00"))
+            return handle, before
+
+        logger._get_handle = get_handle_then_append_elsewhere
+        logger.log("Gym", "Departure", file_format, timestamp="2025-01-01 18:00:00")
+
+    assert evlog.extract_event("Gym", "action", log_dir=log_dir, file_format=file_format)["action"] == "Departure"
+    assert evlog.extract_event("Gym", "action", "Lunch", log_dir=log_dir, file_format=file_format)["action"] == "Lunch"
+    assert evlog.extract_event("Gym", "action", "Arrival", log_dir=log_dir, file_format=file_format)["action"] == "Arrival"
+    events = evlog.query_events("Gym", file_format=file_format, log_dir=log_dir)
+    assert [event["action"] for event in events] == ["Arrival", "Lunch", "Departure"]
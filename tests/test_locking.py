@@ -0,0 +1,30 @@
+import multiprocessing
+
+import pytest
+
+import evlog
+
+FORMATS = ("txt", "csv", "json", "jsonl", "bin")
+PROCESSES = 4
+EVENTS = 50
+
+
+def _write_events(log_dir, file_format, worker):
+    evlog.enable_file_locking()
+    with evlog.EventLogger(log_dir, batch_size=5) as logger:
+        for number in range(EVENTS):
+            logger.log("Gym", f"worker-{worker}-{number}", file_format)
+
+
+@pytest.mark.parametrize("file_format", FORMATS)
+def test_processes_sharing_a_log_lose_no_events(log_dir, file_format):
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=_write_events, args=(log_dir, file_format, worker)) for worker in range(PROCESSES)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(60)
+        assert worker.exitcode == 0
+
+    actions = [event["action"] for event in evlog.query_events("Gym", file_format=file_format, log_dir=log_dir)]
+    assert sorted(actions) == sorted(f"worker-{worker}-{number}" for worker in range(PROCESSES) for number in range(EVENTS))
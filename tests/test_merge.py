@@ -0,0 +1,85 @@
+import json
+import os
+import tracemalloc
+
+import pytest
+
+import evlog
+
+
+def _write_jsonl(log_dir, location, events):
+    with open(os.path.join(log_dir, f"{location}_Tracking.jsonl"), "w") as file:
+        for second in range(events):
+            timestamp = f"2025-01-{1 + second // 86400:02d} {second // 3600 % 24:02d}:{second // 60 % 60:02d}:{second % 60:02d}"
+            file.write(json.dumps({"location": location, "action": "Arrival", "timestamp": timestamp}) + "\n")
+
+
+def _merge_peak(log_dir, events):
+    locations = [f"A{events}", f"B{events}"]
+    for location in locations:
+        _write_jsonl(log_dir, location, events)
+
+    evlog.clear_cache()
+    tracemalloc.start()
+    try:
+        merged_file = evlog.merge_logs(locations, "jsonl", log_dir)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return merged_file, peak
+
+
+def test_merge_memory_does_not_grow_with_the_number_of_events(log_dir):
+    os.makedirs(log_dir)
+    _, small_peak = _merge_peak(log_dir, 5000)
+    merged_file, large_peak = _merge_peak(log_dir, 40000)
+
+    assert large_peak < 2 * small_peak
+
+    with open(merged_file) as file:
+        timestamps = [json.loads(line)["timestamp"] for line in file]
+    assert len(timestamps) == 80000
+    assert timestamps == sorted(timestamps)
+
+
+def test_merge_beyond_the_fan_in_goes_through_intermediate_runs(log_dir, monkeypatch):
+    from evlog import logger
+
+    monkeypatch.setattr(logger, "MERGE_FAN_IN", 2)
+    os.makedirs(log_dir)
+    locations = [f"L{number}" for number in range(5)]
+    for location in locations:
+        _write_jsonl(log_dir, location, 3)
+
+    merged_file = evlog.merge_logs(locations, "jsonl", log_dir)
+
+    with open(merged_file) as file:
+        entries = [json.loads(line) for line in file]
+    # Sorted by time, ties in the order of the locations list
+    assert [(entry["timestamp"][-2:], entry["location"]) for entry in entries] == [
+        (f"{second:02d}", location) for second in range(3) for location in locations
+    ]
+    assert sorted(os.listdir(log_dir)) == sorted([f"{location}_Tracking.jsonl" for location in locations] + ["Merged_Logs.jsonl"])
+
+
+def test_failed_merge_leaves_the_previous_output_and_no_temporary_files(log_dir, monkeypatch):
+    from evlog import logger
+
+    os.makedirs(log_dir)
+    _write_jsonl(log_dir, "A", 3)
+    for output_format in ("bin", "jsonl"):
+        evlog.merge_logs(["A"], output_format, log_dir, input_format="jsonl")
+    files = {name: open(os.path.join(log_dir, name), "rb").read() for name in os.listdir(log_dir) if name != ".evlog"}
+
+    iter_entries = logger._iter_entries
+
+    def failing_entries(log_file, file_format):
+        yield next(iter_entries(log_file, file_format))
+        raise OSError("disk full")
+
+    monkeypatch.setattr(logger, "_iter_entries", failing_entries)
+    for output_format in ("bin", "jsonl"):
+        with pytest.raises(OSError):
+            evlog.merge_logs(["A"], output_format, log_dir, input_format="jsonl")
+
+    assert {name: open(os.path.join(log_dir, name), "rb").read() for name in os.listdir(log_dir) if name != ".evlog"} == files
@@ -0,0 +1,51 @@
+import json
+import os
+
+import evlog
+from evlog.logger import _checkpoint_path, _index_path
+
+
+def _write_json_log(log_dir, location, *timestamps):
+    os.makedirs(log_dir, exist_ok=True)
+    entries = [
+        {"location": location, "action": "Departure" if position % 2 else "Arrival", "timestamp": timestamp}
+        for position, timestamp in enumerate(timestamps)
+    ]
+    with open(os.path.join(log_dir, f"{location}_Tracking.json"), "w") as file:
+        json.dump(entries, file, indent=4)
+
+
+def test_migration_keeps_existing_jsonl_entries_after_the_history(log_dir):
+    _write_json_log(log_dir, "Gym", "2025-01-01 10:00:00", "2025-01-01 10:30:00")
+    evlog.log_event("Gym", "Arrival", "jsonl", log_dir)
+
+    assert evlog.migrate_json_to_jsonl(log_dir) == [os.path.join(log_dir, "Gym_Tracking.jsonl")]
+
+    with open(os.path.join(log_dir, "Gym_Tracking.jsonl")) as file:
+        actions = [json.loads(line)["action"] for line in file]
+    assert actions == ["Arrival", "Departure", "Arrival"]
+
+
+def test_running_the_migration_twice_does_not_duplicate_the_history(log_dir):
+    _write_json_log(log_dir, "Gym", "2025-01-01 10:00:00", "2025-01-01 10:30:00")
+    evlog.migrate_json_to_jsonl(log_dir)
+    evlog.log_event("Gym", "Arrival", "jsonl", log_dir)
+
+    assert evlog.migrate_json_to_jsonl(log_dir) == []
+
+    with open(os.path.join(log_dir, "Gym_Tracking.jsonl")) as file:
+        assert sum(1 for _ in file) == 3
+    assert str(evlog.calculate_total_time("Gym", "jsonl", log_dir, write_summary=False)) == "0:30:00"
+
+
+def test_remove_source_deletes_the_json_log_and_its_sidecars(log_dir):
+    _write_json_log(log_dir, "Gym", "2025-01-01 10:00:00", "2025-01-01 10:30:00")
+    source_file = os.path.join(log_dir, "Gym_Tracking.json")
+    evlog.calculate_total_time("Gym", "json", log_dir, incremental=True)
+    evlog.rebuild_index("Gym", "json", log_dir)
+
+    evlog.migrate_json_to_jsonl(log_dir, remove_source=True)
+
+    assert not os.path.exists(source_file)
+    assert not os.path.exists(_checkpoint_path(source_file))
+    assert not os.path.exists(_index_path(source_file))
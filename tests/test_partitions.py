@@ -0,0 +1,44 @@
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+import evlog
+
+FORMATS = ("txt", "csv", "json", "jsonl", "bin")
+
+
+def _log(log_dir, file_format, *events):
+    with evlog.EventLogger(log_dir, batch_size=1) as logger:
+        for action, timestamp, partition in events:
+            logger.log("Gym", action, file_format, timestamp=timestamp, partition=partition)
+
+
+@pytest.mark.parametrize("file_format", FORMATS)
+def test_partitioned_total_pairs_events_across_files_by_time(log_dir, file_format):
+    # The month partition sorts after the day partitions but holds an event in between
+    _log(log_dir, file_format,
+         ("Arrival", "2025-01-01 08:00:00", "day"),
+         ("Departure", "2025-01-01 10:00:00", "day"),
+         ("Arrival", "2025-01-01 23:00:00", "month"),
+         ("Departure", "2025-01-02 01:00:00", "day"))
+
+    assert str(evlog.calculate_total_time("Gym", file_format, log_dir, write_summary=False)) == "4:00:00"
+    assert evlog.calculate_group_totals("Gym", "day", file_format, log_dir) == {"2025-01-01": timedelta(hours=4)}
+
+    latest = evlog.extract_event("Gym", "action", log_dir=log_dir, file_format=file_format)
+    assert latest["timestamp"] == "2025-01-02 01:00:00"
+    latest_arrival = evlog.extract_event("Gym", "action", "Arrival", log_dir=log_dir, file_format=file_format)
+    assert latest_arrival["timestamp"] == "2025-01-01 23:00:00"
+
+
+def test_cleanup_deletes_partitions_by_period(log_dir):
+    today = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    _log(log_dir, "jsonl",
+         ("Arrival", "2020-01-01 08:00:00", "day"),
+         ("Departure", "2020-01-01 09:00:00", "month"),
+         ("Arrival", today, "day"))
+
+    evlog.cleanup_old_logs(days=30, log_dir=log_dir)
+
+    assert sorted(os.listdir(log_dir)) == [".evlog", f"Gym_Tracking.{today[:10]}.jsonl"]
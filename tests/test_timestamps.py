@@ -0,0 +1,55 @@
+import json
+import os
+import time
+
+import pytest
+
+import evlog
+from evlog.logger import parse_timestamp, timestamp_to_epoch
+
+
+@pytest.fixture
+def new_york(monkeypatch):
+    """Runs the test in a time zone that is not UTC."""
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.mark.parametrize("value", [
+    "2025-03-16 -1:00:00",
+    "2025-03-16 1 :00:00",
+    "+025-03-16 10:00:00",
+    "2025-03-16 10:00:0x",
+    "2025-03-16T10:00:00",
+    "-1700000000",
+    "",
+])
+def test_malformed_timestamps_are_rejected(value):
+    with pytest.raises(ValueError):
+        timestamp_to_epoch(value)
+
+
+def test_epoch_timestamps_are_unix_time(log_dir, new_york):
+    before = int(time.time())
+    evlog.log_event("Gym", "Arrival", "jsonl", log_dir, timestamp_format="epoch")
+
+    with open(os.path.join(log_dir, "Gym_Tracking.jsonl")) as file:
+        stored = json.loads(file.readline())["timestamp"]
+    assert before <= stored <= time.time()
+    assert parse_timestamp(stored).strftime("%Y-%m-%d %H:%M") == time.strftime("%Y-%m-%d %H:%M", time.localtime(stored))
+
+
+@pytest.mark.parametrize("file_format", ["txt", "csv", "json", "jsonl", "bin"])
+def test_text_and_epoch_timestamps_share_a_log(log_dir, new_york, file_format):
+    departure = int(time.mktime(time.strptime("2025-07-01 10:00:00", "%Y-%m-%d %H:%M:%S")))
+    with evlog.EventLogger(log_dir, partition="day") as logger:
+        logger.log("Gym", "Arrival", file_format, timestamp="2025-07-01 08:00:00")
+        logger.log("Gym", "Departure", file_format, timestamp=departure)
+
+    assert os.path.exists(os.path.join(log_dir, f"Gym_Tracking.2025-07-01.{file_format}"))
+    assert str(evlog.calculate_total_time("Gym", file_format, log_dir, write_summary=False)) == "2:00:00"
+    events = evlog.query_events("Gym", start=departure, file_format=file_format, log_dir=log_dir)
+    assert [event["action"] for event in events] == ["Departure"]